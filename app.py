@@ -12,6 +12,8 @@ Set these environment variables before running:
 from __future__ import annotations
 
 import asyncio
+import hashlib
+import json
 import logging
 import os
 import traceback
@@ -21,6 +23,7 @@ from discord import app_commands
 from discord.ext import commands
 
 import database
+import http_client
 
 # ── logging ───────────────────────────────────────────────────────────────────
 logging.basicConfig(
@@ -73,14 +76,51 @@ async def on_app_command_error(
         pass   # interaction already expired — nothing we can do
 
 
-# ── on_ready: sync commands to every guild immediately ────────────────────────
+# ── on_ready: sync commands once per process ─────────────────────────────────
+#
+# on_ready fires again after every gateway reconnect, and a sync is one REST
+# call (per guild, for the cleanup) against tight rate limits.  So the startup
+# work runs only on the first on_ready, the legacy guild-command cleanup runs
+# once per application (recorded in bot_state), and the global sync is skipped
+# when the command tree's payload hashes the same as the last one synced.
+
+_startup_done = False
+
 
 @bot.event
 async def on_ready():
+    global _startup_done
     log.info("Logged in as %s (id=%s)", bot.user, bot.user.id)
+    if _startup_done:
+        return
+    _startup_done = True
 
-    # Clear any guild-specific commands that were registered previously
-    # (they cause duplicates alongside global commands)
+    await _clear_guild_commands()
+    await _sync_all()
+
+
+def _tree_fingerprint() -> str:
+    """SHA-256 of the payload tree.sync() would send."""
+    payload = sorted(
+        (cmd.to_dict(bot.tree) for cmd in bot.tree.get_commands()),
+        key=lambda c: (c.get("type", 1), c["name"]),
+    )
+    return hashlib.sha256(json.dumps(payload, sort_keys=True).encode()).hexdigest()
+
+
+async def _clear_guild_commands():
+    """
+    Clear guild-specific commands registered by older versions (they cause
+    duplicates alongside global commands).  Runs once per application.
+    """
+    key = f"guild_commands_cleared:{bot.user.id}"
+    try:
+        if await database.get_bot_state(key):
+            return
+    except Exception as e:
+        log.warning("Couldn't read bot state (%s) – clearing guild commands anyway", e)
+
+    failed = 0
     for guild in bot.guilds:
         try:
             bot.tree.clear_commands(guild=guild)
@@ -88,17 +128,38 @@ async def on_ready():
             log.info("Cleared guild-specific commands for %s (%s)", guild.name, guild.id)
         except Exception as e:
             log.warning("Failed to clear guild commands for %s: %s", guild.id, e)
+            failed += 1
+
+    if not failed:
+        try:
+            await database.set_bot_state(key, "1")
+        except Exception as e:
+            log.warning("Couldn't record guild command cleanup: %s", e)
 
-    await _sync_all()
 
+async def _sync_all(force: bool = False):
+    """Sync the command tree globally, unless it matches the last synced tree."""
+    key = f"command_tree_hash:{bot.user.id}"
+    fingerprint = _tree_fingerprint()
+    if not force:
+        try:
+            if await database.get_bot_state(key) == fingerprint:
+                log.info("Command tree unchanged since last sync – skipping global sync")
+                return
+        except Exception as e:
+            log.warning("Couldn't read command tree hash (%s) – syncing", e)
 
-async def _sync_all():
-    """Sync the command tree globally."""
     try:
         synced = await bot.tree.sync()
         log.info("Synced %d global command(s)", len(synced))
     except Exception as e:
         log.error("Global sync failed: %s", e)
+        return
+
+    try:
+        await database.set_bot_state(key, fingerprint)
+    except Exception as e:
+        log.warning("Couldn't record command tree hash: %s", e)
 
 
 # ── /sync slash command (admin-only) ─────────────────────────────────────────
@@ -110,7 +171,7 @@ async def slash_sync(interaction: discord.Interaction):
         return
 
     await interaction.response.defer(ephemeral=True)
-    await _sync_all()
+    await _sync_all(force=True)
     await interaction.followup.send(
         "✅ Global sync complete. New commands may take up to an hour to appear in new servers, "
         "but should be available here immediately.",
@@ -121,10 +182,13 @@ async def slash_sync(interaction: discord.Interaction):
 # ── extension loading ─────────────────────────────────────────────────────────
 
 async def main() -> None:
-    database.init_db()
+    await database.init_db()
     log.info("Database initialised ✅")
 
     async with bot:
+        # One pooled HTTP session shared by every cog (see http_client.py)
+        bot.http_session = http_client.create_session()
+
         failed = []
         for fname in sorted(os.listdir("./cogs")):   # sorted = deterministic order
             if fname.endswith(".py"):
@@ -139,7 +203,11 @@ async def main() -> None:
         if failed:
             log.warning("The following extensions failed to load: %s", ", ".join(failed))
 
-        await bot.start(TOKEN)
+        try:
+            await bot.start(TOKEN)
+        finally:
+            await bot.http_session.close()
+            await database.close_db()
 
 
 if __name__ == "__main__":
@@ -18,15 +18,15 @@ Commands
 
 from __future__ import annotations
 
-import asyncio
 from datetime import date
 
 import aiohttp
 import discord
 from discord import app_commands
-from discord.ext import commands
+from discord.ext import commands, tasks
 
 import database
+import statbotics_api as _sbapi
 import tba as _tba
 
 # guild-only context shorthand
@@ -37,6 +37,7 @@ _GUILD_ONLY = app_commands.allowed_contexts(guilds=True, dms=False, private_chan
 _ADMIN_PERMS = app_commands.default_permissions(manage_guild=True)
 
 MAX_ADDEPA = 100
+LEADERBOARD_INTERVAL = 1800   # seconds between background rebuilds of the /addepa leaderboard
 
 
 def is_admin():
@@ -51,7 +52,7 @@ def is_admin():
         # no member cache required, works correctly for owners and admins.
         if interaction.permissions.manage_guild:
             return True
-        cfg = database.get_config(interaction.guild_id)
+        cfg = await database.get_config(interaction.guild_id)
         if cfg and cfg.get("admin_role_id"):
             role = interaction.guild.get_role(cfg["admin_role_id"])
             if role and role in interaction.user.roles:
@@ -70,11 +71,20 @@ class Config(commands.Cog):
         self._session: aiohttp.ClientSession | None = None
 
     async def cog_load(self):
-        self._session = aiohttp.ClientSession()
+        self._session = self.bot.http_session
+        self._refresh_leaderboard.start()
 
     async def cog_unload(self):
-        if self._session:
-            await self._session.close()
+        self._refresh_leaderboard.cancel()
+
+    @tasks.loop(seconds=LEADERBOARD_INTERVAL)
+    async def _refresh_leaderboard(self):
+        """Keep this season's EPA leaderboard warm so /addepa never waits on Statbotics."""
+        await _sbapi.refresh_leaderboard(self._session, date.today().year)
+
+    @_refresh_leaderboard.before_loop
+    async def _before_leaderboard(self):
+        await self.bot.wait_until_ready()
 
     async def cog_app_command_error(
         self,
@@ -102,7 +112,7 @@ class Config(commands.Cog):
     @app_commands.describe(channel="The channel to post announcements in")
     @is_admin()
     async def setup_channel(self, interaction: discord.Interaction, channel: discord.TextChannel):
-        database.set_announce_channel(interaction.guild_id, channel.id)
+        await database.set_announce_channel(interaction.guild_id, channel.id)
         await interaction.response.send_message(
             f"✅ Announcements will now be posted in {channel.mention}.", ephemeral=True
         )
@@ -111,7 +121,7 @@ class Config(commands.Cog):
     @app_commands.describe(role="The role to grant bot-admin access")
     @is_admin()
     async def setup_adminrole(self, interaction: discord.Interaction, role: discord.Role):
-        database.set_admin_role(interaction.guild_id, role.id)
+        await database.set_admin_role(interaction.guild_id, role.id)
         await interaction.response.send_message(
             f"✅ Members with {role.mention} can now use admin bot commands.", ephemeral=True
         )
@@ -132,7 +142,7 @@ class Config(commands.Cog):
             )
             return
 
-        added    = database.add_tracked_team(interaction.guild_id, team_number)
+        added    = await database.add_tracked_team(interaction.guild_id, team_number)
         nickname = info.get("nickname", f"#{team_number}")
 
         if added:
@@ -162,53 +172,25 @@ class Config(commands.Cog):
             )
             return
 
-        try:
-            import statbotics
-            sb     = statbotics.Statbotics()
-            season = date.today().year
-
-            # Statbotics doesn't support order_by — fetch a large pool and sort manually
-            fetch_limit = max(count * 4, 500)
-            teams_data = await asyncio.get_event_loop().run_in_executor(
-                None,
-                lambda: sb.get_team_years(
-                    year=season,
-                    limit=fetch_limit,
-                    offset=0,
-                    fields=["team", "epa"],
-                )
-            )
-        except Exception as e:
+        # Pre-sorted and kept warm by _refresh_leaderboard
+        board = await _sbapi.leaderboard(self._session, date.today().year)
+        if board is None:
             await interaction.followup.send(
-                f"❌ Failed to fetch EPA data from Statbotics: `{e}`", ephemeral=True
+                "❌ Failed to fetch EPA data from Statbotics. Try again later.", ephemeral=True
             )
             return
 
-        if not teams_data:
+        if not board:
             await interaction.followup.send(
                 "⚠️ Statbotics returned no teams. Try again later.", ephemeral=True
             )
             return
 
-        def _epa_val(t: dict) -> float:
-            epa = t.get("epa") or {}
-            if isinstance(epa, dict):
-                return float(epa.get("mean") or epa.get("norm") or 0)
-            return float(epa or 0)
+        top   = [team for team, _ in board[:count]]
+        added = set(await database.add_tracked_teams(interaction.guild_id, top))
 
-        teams_data.sort(key=_epa_val, reverse=True)
-
-        added_teams   = []
-        already_teams = []
-
-        for entry in teams_data[:count]:
-            team_num = str(entry.get("team", "")).replace("frc", "").strip()
-            if not team_num:
-                continue
-            if database.add_tracked_team(interaction.guild_id, team_num):
-                added_teams.append(team_num)
-            else:
-                already_teams.append(team_num)
+        added_teams   = [t for t in top if t in added]
+        already_teams = [t for t in top if t not in added]
 
         embed = discord.Embed(
             title=f"📈 Top {count} EPA Teams Added",
@@ -241,7 +223,7 @@ class Config(commands.Cog):
     @app_commands.describe(team_number="FRC team number, e.g. 5987")
     @is_admin()
     async def removeteam(self, interaction: discord.Interaction, team_number: str):
-        removed = database.remove_tracked_team(interaction.guild_id, team_number)
+        removed = await database.remove_tracked_team(interaction.guild_id, team_number)
         if removed:
             await interaction.response.send_message(
                 f"🗑️ Stopped tracking team **#{team_number}**.", ephemeral=True
@@ -255,7 +237,7 @@ class Config(commands.Cog):
     @app_commands.command(name="listteams", description="List all tracked teams for this server")
     @_GUILD_ONLY
     async def listteams(self, interaction: discord.Interaction):
-        teams = database.get_tracked_teams(interaction.guild_id)
+        teams = await database.get_tracked_teams(interaction.guild_id)
         if not teams:
             await interaction.response.send_message(
                 "No teams are being tracked yet. Use `/addteam` or `/addepa` to add some.",
@@ -278,8 +260,8 @@ class Config(commands.Cog):
     @_GUILD_ONLY
     @is_admin()
     async def serverinfo(self, interaction: discord.Interaction):
-        cfg   = database.get_config(interaction.guild_id)
-        teams = database.get_tracked_teams(interaction.guild_id)
+        cfg   = await database.get_config(interaction.guild_id)
+        teams = await database.get_tracked_teams(interaction.guild_id)
 
         chan_str = "Not set"
         if cfg and cfg.get("announce_channel_id"):
@@ -308,7 +290,7 @@ class Config(commands.Cog):
     @_GUILD_ONLY
     @is_admin()
     async def adminroles(self, interaction: discord.Interaction):
-        cfg = database.get_config(interaction.guild_id)
+        cfg = await database.get_config(interaction.guild_id)
 
         lines = ["**Manage Server** permission — always grants access"]
 
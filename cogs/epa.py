@@ -12,37 +12,50 @@ Commands
 from __future__ import annotations
 
 import asyncio
+import logging
+import time
+from collections.abc import Iterable
 
+import aiohttp
 import discord
 from discord import app_commands
 from discord.ext import commands, tasks
 
 import database
+import statbotics_api as _sbapi
 from cogs.config import is_admin
 
 # guild-only context shorthand
 _GUILD_ONLY = app_commands.allowed_contexts(guilds=True, dms=False, private_channels=False)
 _ADMIN_PERMS = app_commands.default_permissions(manage_guild=True)
 
-try:
-    import statbotics
-    _sb = statbotics.Statbotics()
-    _SB_AVAILABLE = True
-except Exception:
-    _SB_AVAILABLE = False
+log = logging.getLogger("epa")
 
-EPA_POLL_INTERVAL = 3600
+EPA_POLL_INTERVAL = 3600   # slow fallback sweep; match results trigger rechecks
+EPA_RECHECK_DELAY = 300    # give Statbotics time to recompute after a match
+EPA_SEASON        = 2026
+EPA_MIN_DELTA     = 0.5    # smaller moves are not announced
 
 
-def _get_team_epa(team_number: str, year: int | None = None) -> dict | None:
-    if not _SB_AVAILABLE:
-        return None
-    try:
-        if year:
-            return _sb.get_team_year(int(team_number), year)
-        return _sb.get_team(int(team_number))
-    except Exception:
+async def _fetch_season_epas(
+    session: aiohttp.ClientSession, year: int, teams: set[str],
+) -> dict[str, float] | None:
+    """
+    Return {team_number: epa_mean} for every team in `teams`, read from one
+    paginated sweep of the season's team-years.  Returns None if Statbotics
+    failed part-way, so a cycle never acts on a partial season.
+    """
+    rows = await _sbapi.season_team_years(session, year)
+    if rows is None:
         return None
+    wanted = {str(t) for t in teams}
+    result: dict[str, float] = {}
+    for row in rows:
+        team = str(row.get("team"))
+        mean = _sbapi.epa_mean(row)
+        if team in wanted and mean is not None:
+            result[team] = mean
+    return result
 
 
 class EPA(commands.Cog):
@@ -50,13 +63,21 @@ class EPA(commands.Cog):
 
     def __init__(self, bot: commands.Bot):
         self.bot = bot
+        self._session: aiohttp.ClientSession | None = None
+        # {team_number: time.monotonic() deadline} – teams waiting for a recheck
+        self._recheck_due: dict[str, float] = {}
+        self._recheck_task: asyncio.Task | None = None
+        # Serialises baseline diffs so a recheck and the sweep can't both announce
+        self._apply_lock = asyncio.Lock()
 
     async def cog_load(self):
-        if _SB_AVAILABLE:
-            self.poll_epa_changes.start()
+        self._session = self.bot.http_session
+        self.poll_epa_changes.start()
 
     async def cog_unload(self):
         self.poll_epa_changes.cancel()
+        if self._recheck_task:
+            self._recheck_task.cancel()
 
     # ── /trackepa (guild-only) ────────────────────────────────────────────────
     @_ADMIN_PERMS
@@ -65,22 +86,24 @@ class EPA(commands.Cog):
     @app_commands.describe(team_number="FRC team number, e.g. 5987")
     @is_admin()
     async def trackepa(self, interaction: discord.Interaction, team_number: str):
-        await interaction.response.defer(ephemeral=True)
-
-        if not _SB_AVAILABLE:
-            await interaction.followup.send("⚠️ Statbotics library not available.", ephemeral=True)
+        team_number = team_number.strip()
+        if not team_number.isdigit():
+            await interaction.response.send_message(
+                f"⚠️ `{team_number}` isn't a team number – use digits only, e.g. `5987`.", ephemeral=True
+            )
             return
+        await interaction.response.defer(ephemeral=True)
 
-        data = await asyncio.get_event_loop().run_in_executor(
-            None, lambda: _get_team_epa(team_number, 2026)
-        )
-        current_epa = data.get("epa", {}).get("mean") if data else None
+        data = await _sbapi.team_year(self._session, team_number, EPA_SEASON)
+        current_epa = _sbapi.epa_mean(data)
 
-        added = database.add_epa_tracking(interaction.guild_id, team_number, current_epa)
+        added = await database.add_epa_tracking(interaction.guild_id, team_number, current_epa)
         if added:
             await interaction.followup.send(
                 f"✅ EPA tracking enabled for **#{team_number}**."
-                + (f" Baseline EPA: `{current_epa:.2f}`" if current_epa else ""),
+                + (f" Baseline EPA: `{current_epa:.2f}`" if current_epa is not None else
+                   f" Statbotics has no {EPA_SEASON} EPA for this team yet – the first value"
+                   " it reports becomes the baseline."),
                 ephemeral=True,
             )
         else:
@@ -95,7 +118,7 @@ class EPA(commands.Cog):
     @app_commands.describe(team_number="FRC team number")
     @is_admin()
     async def untrackepa(self, interaction: discord.Interaction, team_number: str):
-        removed = database.remove_epa_tracking(interaction.guild_id, team_number)
+        removed = await database.remove_epa_tracking(interaction.guild_id, team_number)
         if removed:
             await interaction.response.send_message(
                 f"🗑️ Stopped EPA tracking for **#{team_number}**.", ephemeral=True
@@ -116,54 +139,115 @@ class EPA(commands.Cog):
         else:
             await interaction.followup.send(msg, ephemeral=True)
 
+    # ── match-triggered rechecks ──────────────────────────────────────────────
+    def schedule_recheck(self, team_numbers: Iterable[str]) -> None:
+        """
+        Recheck these teams' EPA EPA_RECHECK_DELAY seconds from now.  Called by
+        LiveWatch when it sees a completed match; a team that plays again before
+        its recheck runs has the deadline pushed back rather than queued twice.
+        """
+        due = time.monotonic() + EPA_RECHECK_DELAY
+        for team in team_numbers:
+            self._recheck_due[str(team)] = due
+        if self._recheck_due and (self._recheck_task is None or self._recheck_task.done()):
+            self._recheck_task = asyncio.create_task(self._run_rechecks())
+
+    async def _run_rechecks(self):
+        while self._recheck_due:
+            now = time.monotonic()
+            due = {t for t, at in self._recheck_due.items() if at <= now}
+            if not due:
+                await asyncio.sleep(min(self._recheck_due.values()) - now)
+                continue
+            for team in due:
+                del self._recheck_due[team]
+            try:
+                await self._recheck(due)
+            except Exception:
+                log.exception("EPA recheck failed for %d team(s)", len(due))
+
+    async def _recheck(self, teams: set[str]) -> None:
+        """Fetch EPA for the tracked subset of `teams` and apply any changes."""
+        all_tracked = await database.get_all_epa_tracked()
+        wanted = {
+            row["team_number"] for rows in all_tracked.values()
+            for row in rows if row["team_number"] in teams
+        }
+        if not wanted:
+            return
+
+        ordered = sorted(wanted)
+        results = await asyncio.gather(*(
+            _sbapi.team_year(self._session, team, EPA_SEASON) for team in ordered
+        ))
+        epas = {
+            team: epa for team, data in zip(ordered, results)
+            if (epa := _sbapi.epa_mean(data)) is not None
+        }
+        updates = await self._apply_epas(epas)
+        log.info("EPA recheck: %d team(s), %d baseline update(s)", len(wanted), updates)
+
     # ── background EPA polling ────────────────────────────────────────────────
     @tasks.loop(seconds=EPA_POLL_INTERVAL)
     async def poll_epa_changes(self):
-        all_tracked = database.get_all_epa_tracked()
-
-        for guild_id, teams in all_tracked.items():
-            cfg = database.get_config(guild_id)
-            if not cfg or not cfg.get("announce_channel_id"):
-                continue
-            channel = self.bot.get_channel(cfg["announce_channel_id"])
-            if not channel:
-                continue
+        """
+        Fallback sweep: fetch the season's EPA once for the unique set of
+        tracked teams and apply it to every guild's baseline.
+        """
+        all_tracked = await database.get_all_epa_tracked()
+        teams = {row["team_number"] for rows in all_tracked.values() for row in rows}
+        if not teams:
+            return
 
-            for row in teams:
-                team_number = row["team_number"]
-                old_epa     = row["last_epa"]
+        epas = await _fetch_season_epas(self._session, EPA_SEASON, teams)
+        if epas is None:
+            return
 
-                data = await asyncio.get_event_loop().run_in_executor(
-                    None, lambda: _get_team_epa(team_number, 2026)
-                )
-                if not data:
+        updates = await self._apply_epas(epas)
+        log.info("EPA poll: %d unique team(s), %d baseline update(s)", len(teams), updates)
+
+    async def _apply_epas(self, epas: dict[str, float]) -> int:
+        """
+        Diff `epas` ({team_number: epa}) against every guild's stored baseline,
+        announce moves of at least EPA_MIN_DELTA, and write all new baselines
+        back in one statement.  Returns the number of baselines written.
+        """
+        async with self._apply_lock:
+            all_tracked = await database.get_all_epa_tracked()
+            updates: list[tuple[int, str, float]] = []
+            for guild_id, rows in all_tracked.items():
+                rows = [r for r in rows if r["team_number"] in epas]
+                if not rows:
                     continue
-
-                new_epa = data.get("epa", {}).get("mean")
-                if new_epa is None:
+                cfg = await database.get_config(guild_id)
+                if not cfg or not cfg.get("announce_channel_id"):
                     continue
-
-                if old_epa is None:
-                    database.update_last_epa(guild_id, team_number, new_epa)
+                channel = self.bot.get_channel(cfg["announce_channel_id"])
+                if not channel:
                     continue
 
-                delta = new_epa - old_epa
-                if abs(delta) < 0.5:
-                    continue
+                for row in rows:
+                    team_number = row["team_number"]
+                    old_epa     = row["last_epa"]
+                    new_epa     = epas[team_number]
+
+                    if old_epa is None:
+                        updates.append((guild_id, team_number, new_epa))
+                        continue
+
+                    if abs(new_epa - old_epa) < EPA_MIN_DELTA:
+                        continue
 
-                direction = "📈" if delta > 0 else "📉"
-                embed = discord.Embed(
-                    title=f"{direction} EPA Update – Team #{team_number}",
-                    description=(
-                        f"**Previous EPA:** `{old_epa:.2f}`\n"
-                        f"**Current EPA:**  `{new_epa:.2f}`\n"
-                        f"**Change:** `{delta:+.2f}`"
-                    ),
-                    color=discord.Color.green() if delta > 0 else discord.Color.red(),
-                )
-                embed.set_footer(text="Powered by Statbotics • FRC Bot")
-                await channel.send(embed=embed)
-                database.update_last_epa(guild_id, team_number, new_epa)
+                    try:
+                        await channel.send(embed=_epa_change_embed(team_number, old_epa, new_epa))
+                    except discord.HTTPException as e:
+                        log.warning("Failed to announce EPA change for #%s in guild %s: %s",
+                                    team_number, guild_id, e)
+                        continue
+                    updates.append((guild_id, team_number, new_epa))
+
+            await database.update_last_epas(updates)
+        return len(updates)
 
     @poll_epa_changes.before_loop
     async def before_epa_poll(self):
@@ -172,6 +256,21 @@ class EPA(commands.Cog):
 
 # ── helpers ───────────────────────────────────────────────────────────────────
 
+def _epa_change_embed(team_number: str, old_epa: float, new_epa: float) -> discord.Embed:
+    delta = new_epa - old_epa
+    direction = "📈" if delta > 0 else "📉"
+    embed = discord.Embed(
+        title=f"{direction} EPA Update – Team #{team_number}",
+        description=(
+            f"**Previous EPA:** `{old_epa:.2f}`\n"
+            f"**Current EPA:**  `{new_epa:.2f}`\n"
+            f"**Change:** `{delta:+.2f}`"
+        ),
+        color=discord.Color.green() if delta > 0 else discord.Color.red(),
+    )
+    embed.set_footer(text="Powered by Statbotics • FRC Bot")
+    return embed
+
 
 async def setup(bot: commands.Bot):
     await bot.add_cog(EPA(bot))
@@ -9,19 +9,47 @@ Flow
 ----
 Every EVENT_CACHE_INTERVAL seconds:
   • Fetch each tracked team's current-year events from TBA
-  • Build a unified set of active event keys per guild
-
-Every POLL_INTERVAL seconds:
-  • For each active event, query Nexus for queue status → "on deck / on field" alerts
-  • For each active event, query TBA for completed matches → result embeds
+  • Build the set of unique active events plus an event → guilds routing table
+  • Seed newly active events: their already-played matches are marked as posted
+
+Every PREDICTION_INTERVAL seconds:
+  • Fetch Statbotics predictions in bulk for each event whose schedule or
+    results changed since its last fetch (skipping dormant events)
+
+Every POLL_INTERVAL seconds (the poll tick), for each unique active event that is due:
+  • Query Nexus once for queue status and fan the "on deck / on field" alerts
+    out to every guild routed to that event
+  • Query TBA once for completed matches and fan the result embeds out the same way
+  • Pick the event's next poll time from its phase (see _plan_next_poll):
+    live (tracked team queuing / on field) → every tick, between matches → slow,
+    overnight / before the schedule is published / after the event → dormant
+
+When TBA webhooks are enabled (cogs/webhooks.py), match_score pushes are fed
+straight into the result path via ingest_match() and the TBA match poll for
+that event drops to a RECONCILE_INTERVAL fallback.
+
+TBA, Nexus and Statbotics calls go through resilience.Upstream.  While a
+source's circuit breaker is open, the loops that depend on it skip their turn
+instead of hammering it; they resume on their own once a probe succeeds.  The
+poll tick skips only the degraded source, so Nexus queue alerts keep flowing
+while TBA is down and vice versa.
+
+Every alert posted is recorded in the posted_alerts ledger (keyed by match and
+stage), which is loaded in one query at startup so restarts never re-post.
+Every completed match gets a result row whether or not it was announced, so a
+restart never posts old results for teams tracked since.  Queue alerts are
+only recorded when they had a target: a match that is still upcoming after a
+restart may rightly alert a newly tracked team.
 """
 
 from __future__ import annotations
 
 import asyncio
+import collections
 import datetime as dt
 import logging
 import os
+import time
 from typing import Final
 
 import aiohttp
@@ -29,16 +57,44 @@ import discord
 from discord.ext import commands, tasks
 
 import database
+import resilience
+import statbotics_api as _sbapi
 import tba as _tba
 
 log = logging.getLogger("live_watch")
 
 NEXUS_AUTH: Final[str] = os.environ.get("NEXUS_AUTH", "NFkS99_q6pO8lvyC831Ia_lFkf4")
 NEXUS_BASE  = "https://frc.nexus/api/v1/event"
-SEASON      = int(os.environ.get("FRC_SEASON", "2026"))
+SEASON      = _tba.CURRENT_SEASON   # FRC_SEASON; also the TBA archive cutoff
 
-POLL_INTERVAL        = 30    # seconds – how often to check for new matches / queue status
+POLL_INTERVAL        = 30    # seconds – poll tick; also the cadence of events in the "live" phase
 EVENT_CACHE_INTERVAL = 300   # seconds – how often to re-fetch each team's event list
+PREDICTION_INTERVAL  = 120   # seconds – how often to re-fetch Statbotics predictions per event
+
+# Event refresh fans out one TBA lookup per tracked team / active event.
+# Tune this (and HTTP_LIMIT_PER_HOST in http_client.py) against TBA's rate limits.
+REFRESH_CONCURRENCY = int(os.environ.get("TBA_REFRESH_CONCURRENCY", "8"))   # lookups in flight at once
+
+EVICT_AFTER = 6 * 3600   # seconds an event must stay inactive before its dedup / ranking state is dropped
+
+# Adaptive per-event poll cadence (seconds)
+SLOW_INTERVAL    = 120        # "between" phase – matches running, no tracked team up soon
+DORMANT_INTERVAL = 900        # "dormant" phase – overnight, no schedule yet, or event finished
+LIVE_LEAD        = 25 * 60    # a tracked team's match starting within this → "live"
+LIVE_TAIL        = 20 * 60    # stay "live" this long after a tracked match's start until its result lands
+DORMANT_GAP      = 2 * 3600   # next match (and last result) further away than this → "dormant"
+
+_NEXUS_LIVE_STATUSES = {"Now queuing", "On deck", "On field"}
+
+# TBA webhooks (cogs/webhooks.py): while an event is receiving pushes, its match
+# list is only re-polled every RECONCILE_INTERVAL as a fallback
+PUSH_FRESH         = 30 * 60   # seconds since the last push before we fall back to normal polling
+RECONCILE_INTERVAL = 300
+
+DM_CONCURRENCY = int(os.environ.get("DM_CONCURRENCY", "5"))   # personal-subscriber DMs in flight at once
+
+# Nexus is polled once per due event per tick; one quick retry keeps the tick short
+_NEXUS = resilience.Upstream("nexus", rate=5, burst=10, retries=1)
 
 # Nexus uses different identifiers only for CMP divisions; all other events match TBA keys.
 _TBA_TO_NEXUS_OVERRIDE: dict[str, str] = {
@@ -52,13 +108,6 @@ _TBA_TO_NEXUS_OVERRIDE: dict[str, str] = {
     "2026new": "2026newton",
 }
 
-try:
-    import statbotics
-    _sb = statbotics.Statbotics()
-    _SB_OK = True
-except Exception:
-    _SB_OK = False
-
 
 # ── Helpers ───────────────────────────────────────────────────────────────────
 
@@ -101,6 +150,87 @@ def _is_event_active(event: dict) -> bool:
     return end >= today - dt.timedelta(days=1) and start.year == SEASON
 
 
+def _event_of(match_key: str) -> str:
+    """TBA event key for a match key ('2026isde1_qm12' → '2026isde1'); event keys map to themselves."""
+    return match_key.partition("_")[0]
+
+
+def _match_teams(match: dict) -> set[str]:
+    """Team numbers (without the 'frc' prefix) on both alliances of a TBA match."""
+    return {t[3:] for t in (
+        match["alliances"]["red"]["team_keys"] +
+        match["alliances"]["blue"]["team_keys"]
+    )}
+
+
+def _is_completed(match: dict) -> bool:
+    """
+    True once both alliance scores are in.  TBA reports -1 for unplayed matches,
+    and winning_alliance is "" for a tie, so it can't be used on its own.
+    """
+    alliances = match.get("alliances") or {}
+    scores = [(alliances.get(c) or {}).get("score") for c in ("red", "blue")]
+    return all(isinstance(sc, int) and sc >= 0 for sc in scores)
+
+
+def _match_signature(matches: list | None) -> tuple[int, int]:
+    """(scheduled, completed) match counts; changes when a schedule is published or a result lands."""
+    matches = matches or []
+    return len(matches), sum(1 for m in matches if _is_completed(m))
+
+
+def _plan_next_poll(
+    tba_key: str,
+    tracked: set[str],
+    nexus_data: dict | None,
+    matches: list | None,
+) -> tuple[str, int]:
+    """
+    Return (phase, seconds until the next poll) for an event from its latest
+    Nexus queue status and TBA match list:
+
+      live     – a tracked team is queuing / on deck / on field, its match starts
+                 within LIVE_LEAD, or it started within LIVE_TAIL with no result yet
+      between  – matches are running but no tracked team is up soon; polled every
+                 SLOW_INTERVAL, waking early enough to go live LIVE_LEAD ahead
+      dormant  – no upcoming match within DORMANT_GAP and nothing played recently
+                 (overnight, schedule not published, event over)
+    """
+    now = time.time()
+
+    # {match_key: (start_ts, involves a tracked team)} for every unplayed match
+    upcoming: dict[str, tuple[float, bool]] = {}
+    last_played = 0.0
+    for m in matches or []:
+        if m.get("actual_time") or _is_completed(m):
+            last_played = max(last_played, float(m.get("actual_time") or 0))
+            continue
+        ts = m.get("predicted_time") or m.get("time")
+        if ts:
+            upcoming[m["key"]] = (float(ts), bool(tracked & _match_teams(m)))
+
+    # Nexus has the better start estimate; it also covers events whose TBA schedule is empty
+    for m in (nexus_data or {}).get("matches", []):
+        mine = bool(tracked & set(m.get("redTeams", []) + m.get("blueTeams", [])))
+        if mine and m.get("status") in _NEXUS_LIVE_STATUSES:
+            return "live", POLL_INTERVAL
+        key      = _nexus_label_to_match_key(tba_key, m.get("label", ""))
+        start_ms = (m.get("times") or {}).get("estimatedStartTime")
+        if start_ms and (key in upcoming or not matches):
+            upcoming[key] = (start_ms / 1000, mine)
+
+    mine_starts = [ts for ts, mine in upcoming.values() if mine and ts >= now - LIVE_TAIL]
+    if any(ts <= now + LIVE_LEAD for ts in mine_starts):
+        return "live", POLL_INTERVAL
+
+    # Wake up in time to be live LIVE_LEAD before the next tracked match
+    wake = min(mine_starts) - LIVE_LEAD - now if mine_starts else DORMANT_INTERVAL
+    future = [ts for ts, _ in upcoming.values() if ts >= now - LIVE_TAIL]
+    if (not future or min(future) - now > DORMANT_GAP) and now - last_played > DORMANT_GAP:
+        return "dormant", int(max(POLL_INTERVAL, min(wake, DORMANT_INTERVAL)))
+    return "between", int(max(POLL_INTERVAL, min(wake, SLOW_INTERVAL)))
+
+
 def _webcast_url(event_data: dict) -> str | None:
     """
     Return the stream URL that is most likely live right now.
@@ -153,27 +283,95 @@ def _match_view(match_key: str, webcast_url: str | None) -> discord.ui.View:
     return view
 
 
-def _win_probability(match_key: str, side: str) -> tuple[float, str] | tuple[None, None]:
+async def _fetch_event_predictions(
+    session: aiohttp.ClientSession, event_key: str,
+) -> dict[str, tuple[float, str]] | None:
     """
-    Returns (win_prob, predicted_winner) from Statbotics, or (None, None) if
-    the match isn't found or has no prediction yet.  Never returns a fake 50%.
+    Return {match_key: (red_win_prob, predicted_winner)} for every match at an
+    event that Statbotics has a prediction for, or None on error.
     """
-    if not _SB_OK:
-        return None, None
-    try:
-        m    = _sb.get_match(match_key)
-        if not m:
-            return None, None
-        pred = m.get("pred") or {}
-        rwp  = pred.get("red_win_prob")
+    matches = await _sbapi.event_matches(session, event_key)
+    if matches is None:
+        return None
+    preds: dict[str, tuple[float, str]] = {}
+    for m in matches:
+        pred   = m.get("pred") or {}
+        rwp    = pred.get("red_win_prob")
         winner = pred.get("winner")
-        if rwp is None or winner is None:
-            return None, None
-        prob = float(rwp) if side == "red" else 1 - float(rwp)
-        return prob, str(winner)
-    except Exception as e:
-        log.debug("Statbotics lookup failed for %s: %s", match_key, e)
-        return None, None
+        if m.get("key") and rwp is not None and winner is not None:
+            preds[m["key"]] = (float(rwp), str(winner))
+    return preds
+
+
+# ── Personal-subscriber DMs ───────────────────────────────────────────────────
+
+class _DMDispatcher:
+    """
+    Delivers each (match_key, stage) alert to personal subscribers exactly once.
+
+    Subscribers come from the in-memory team → users index in database.py,
+    DM channels are cached per user, and sends run in a background task under
+    a semaphore (discord.py handles per-route 429s itself), so a popular team
+    never stalls the poll loop.
+    """
+
+    def __init__(self, bot: commands.Bot):
+        self._bot = bot
+        self._sem = asyncio.Semaphore(DM_CONCURRENCY)
+        self._channels: dict[int, discord.DMChannel] = {}
+        self._sent: set[tuple[str, str]] = set()   # (match_key, stage)
+        self._tasks: set[asyncio.Task] = set()
+
+    def dispatch(
+        self,
+        match_key: str,
+        stage: str,
+        teams: set[str],
+        embed: discord.Embed,
+        view: discord.ui.View | None = None,
+    ) -> None:
+        if (match_key, stage) in self._sent:
+            return
+        self._sent.add((match_key, stage))
+        task = asyncio.create_task(self._deliver(match_key, stage, teams, embed, view))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _deliver(self, match_key, stage, teams, embed, view) -> None:
+        users = await database.subscribers_for_teams(teams)
+        if not users:
+            return
+        results = await asyncio.gather(*(self._send(u, embed, view) for u in users))
+        log.debug("DM'd %d/%d subscriber(s) for %s (%s)", sum(results), len(users), match_key, stage)
+
+    async def _send(self, user_id: int, embed: discord.Embed, view: discord.ui.View | None) -> bool:
+        async with self._sem:
+            try:
+                channel = self._channels.get(user_id)
+                if channel is None:
+                    user = self._bot.get_user(user_id) or await self._bot.fetch_user(user_id)
+                    channel = user.dm_channel or await user.create_dm()
+                    self._channels[user_id] = channel
+                if view is not None:
+                    await channel.send(embed=embed, view=view)
+                else:
+                    await channel.send(embed=embed)
+                return True
+            except discord.Forbidden:
+                return False   # user has DMs closed
+            except Exception:
+                log.debug("DM to user %s failed", user_id, exc_info=True)
+                return False
+
+    def evict(self, event_keys: set[str]) -> None:
+        self._sent = {e for e in self._sent if _event_of(e[0]) not in event_keys}
+
+    def __len__(self) -> int:
+        return len(self._sent)
+
+    def close(self) -> None:
+        for task in self._tasks:
+            task.cancel()
 
 
 # ── Main cog ──────────────────────────────────────────────────────────────────
@@ -187,88 +385,123 @@ class LiveWatch(commands.Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
         self._http: aiohttp.ClientSession | None = None
+        self._dm = _DMDispatcher(bot)
+
+        # {tba_event_key: event_dict}  – every unique active event, refreshed periodically
+        self._active_events: dict[str, dict] = {}
+        # {tba_event_key: {guild_id}}  – which guilds track a team at each event
+        self._event_guilds: dict[str, set[int]] = {}
+
+        # Dedup sets, mirrored to the posted_alerts ledger
+        self._seen_upcoming:  set[tuple[str, str]] = set()   # (match_key, stage)
+        self._seen_results:   set[str]             = set()   # match_key
+        self._seeded_events:  set[str]             = set()   # event keys whose old results are marked
 
-        # {guild_id: {tba_event_key: event_dict}}  – refreshed periodically
-        self._active_events: dict[int, dict[str, dict]] = {}
+        # {(guild_id, team_number): event keys already seen} – mirrors known_team_events,
+        # loaded once at startup and written through by _check_new_event_registrations
+        self._known_events: dict[tuple[int, str], set[str]] = {}
 
-        # Dedup sets
-        self._seen_upcoming: set[tuple] = set()   # (guild_id, nexus_key, label, stage)
-        self._seen_results:  set[tuple] = set()   # (guild_id, match_key)
+        # Statbotics predictions: {match_key: (red_win_prob, predicted_winner)}
+        self._predictions: dict[str, tuple[float, str]] = {}
+        # Events whose matches changed since their predictions were last fetched
+        self._predictions_due: set[str] = set()
 
-        # Nickname cache to avoid hammering TBA
-        self._nickname_cache: dict[str, str] = {}
+        # Adaptive scheduling: {tba_event_key: time.monotonic() due time} and current phase
+        self._next_poll: dict[str, float] = {}
+        self._phase:     dict[str, str]   = {}
 
-        # Rankings cache: {event_key: {team_number: rank}}
-        # Stores rankings BEFORE each match so we can show movement after
-        self._rankings_before: dict[str, dict[str, int]] = {}
-        self._rankings_now:    dict[str, dict[str, int]] = {}
+        # TBA webhook push: last push per event, next reconciliation poll, last match list
+        self._last_push:      dict[str, float] = {}
+        self._next_reconcile: dict[str, float] = {}
+        self._last_matches:   dict[str, list]  = {}
+
+        # {tba_event_key: time.monotonic()} – last refresh that saw the event active
+        self._event_last_active: dict[str, float] = {}
+
+        # Latest rankings per event: {event_key: {team_number: rank}}
+        self._rankings_now: dict[str, dict[str, int]] = {}
 
     async def cog_load(self):
-        self._http = aiohttp.ClientSession()
+        self._http = self.bot.http_session
         asyncio.create_task(self._start())
 
     async def cog_unload(self):
         self._refresh_events.cancel()
+        self._refresh_predictions.cancel()
         self._poll.cancel()
-        if self._http:
-            await self._http.close()
+        self._dm.close()
 
     # ── Startup ───────────────────────────────────────────────────────────────
 
     async def _start(self):
         await self.bot.wait_until_ready()
+        await self._load_ledger()
         await self._do_refresh_events()
-        await self._seed_played()
         await self._seed_rankings()
         self._refresh_events.start()
+        self._refresh_predictions.start()
         self._poll.start()
-        total_events = sum(len(v) for v in self._active_events.values())
+        guilds = set().union(*self._event_guilds.values())
         log.info("LiveWatch ready – watching %d event(s) across %d guild(s)",
-                 total_events, len(self._active_events))
+                 len(self._active_events), len(guilds))
+
+    async def _load_ledger(self):
+        """Restore dedup state for this season from the posted_alerts ledger."""
+        for match_key, stage in await database.get_posted_alerts(SEASON):
+            if stage == "result":
+                self._seen_results.add(match_key)
+            elif stage == "seeded":
+                self._seeded_events.add(match_key)
+            else:
+                self._seen_upcoming.add((match_key, stage))
+        log.info("Loaded alert ledger: %d result(s), %d queue alert(s), %d seeded event(s)",
+                 len(self._seen_results), len(self._seen_upcoming), len(self._seeded_events))
+        self._known_events = await database.get_all_known_events()
+        log.info("Loaded known events for %d guild/team pair(s)", len(self._known_events))
 
     async def _seed_rankings(self):
         """
         Fetch current rankings for every active event on startup.
-        Stored as both _rankings_before and _rankings_now so the first
-        match result after deployment can correctly show rank movement.
+        Stored as _rankings_now so the first match result after deployment
+        can correctly show rank movement.
         """
         seeded = 0
-        seen_events: set[str] = set()
-        for events in self._active_events.values():
-            for event_key in events:
-                if event_key in seen_events:
-                    continue
-                seen_events.add(event_key)
-                ranks = await self._fetch_rankings(event_key)
-                if ranks:
-                    self._rankings_before[event_key] = ranks
-                    self._rankings_now[event_key]    = ranks
-                    seeded += len(ranks)
+        for event_key in self._active_events:
+            ranks = await self._fetch_rankings(event_key)
+            if ranks:
+                self._rankings_now[event_key] = ranks
+                seeded += len(ranks)
         log.info("Seeded rankings for %d event(s) (%d team entries)",
-                 len(seen_events), seeded)
+                 len(self._active_events), seeded)
 
     # ── Event discovery ───────────────────────────────────────────────────────
 
     async def _do_refresh_events(self):
         """
         Query TBA for every tracked team's SEASON events, then update
-        _active_events with the subset that are currently active/upcoming.
+        _active_events with the subset that are currently active/upcoming
+        and rebuild the _event_guilds routing table.
         """
-        all_guild_teams = database.get_all_tracked_teams()
+        started = time.perf_counter()
+        all_guild_teams = await database.get_all_tracked_teams()
+        sem = asyncio.Semaphore(REFRESH_CONCURRENCY)
 
         # De-duplicate API calls: fetch each team's events once, share across guilds
         all_teams: set[str] = {t for teams in all_guild_teams.values() for t in teams}
-        team_event_map: dict[str, list[dict]] = {}
-        for team in all_teams:
-            evs = await _tba.team_events(self._http, team, str(SEASON))
-            team_event_map[team] = evs or []
-            log.debug("Team %s has %d events in %d", team, len(team_event_map[team]), SEASON)
-
-        # Collect all unique active event keys across every guild
-        all_active_keys: set[str] = set()
-        guild_event_keys: dict[int, set[str]] = {}
+
+        async def _team_events(team: str) -> tuple[str, list[dict]]:
+            async with sem:
+                evs = await _tba.team_events(self._http, team, str(SEASON))
+            log.debug("Team %s has %d events in %d", team, len(evs or []), SEASON)
+            return team, evs or []
+
+        team_event_map: dict[str, list[dict]] = dict(
+            await asyncio.gather(*(_team_events(t) for t in all_teams))
+        )
+
+        # Build the event → guilds routing table from every guild's tracked teams
+        event_guilds: dict[str, set[int]] = {}
         for guild_id, tracked_teams in all_guild_teams.items():
-            keys: set[str] = set()
             for team in tracked_teams:
                 for ev in team_event_map.get(team, []):
                     if not isinstance(ev, dict):
@@ -277,40 +510,64 @@ class LiveWatch(commands.Cog):
                     if not isinstance(key, str):
                         continue
                     if _is_event_active(ev):
-                        keys.add(key)
-                        all_active_keys.add(key)
-            guild_event_keys[guild_id] = keys
+                        event_guilds.setdefault(key, set()).add(guild_id)
 
         # Fetch full event data (includes webcasts) for each unique key.
         # Re-use cached data for keys we already have so we don't hammer TBA.
-        existing_full: dict[str, dict] = {}
-        for ev_map in self._active_events.values():
-            existing_full.update(ev_map)
-
         full_event_data: dict[str, dict] = {}
-        for key in all_active_keys:
-            if key in existing_full and existing_full[key].get("webcasts") is not None:
-                full_event_data[key] = existing_full[key]  # already have full data
+        to_fetch: list[str] = []
+        for key in event_guilds:
+            existing = self._active_events.get(key)
+            if existing and existing.get("webcasts") is not None:
+                full_event_data[key] = existing  # already have full data
             else:
-                data = await _tba.event_full(self._http, key)
-                if data:
-                    full_event_data[key] = data
-                    log.debug("Fetched full event data for %s", key)
-
-        new_cache: dict[int, dict[str, dict]] = {}
-        for guild_id, keys in guild_event_keys.items():
-            events_for_guild = {k: full_event_data[k] for k in keys if k in full_event_data}
-
-            prev = set(self._active_events.get(guild_id, {}))
-            curr = set(events_for_guild)
-            if curr - prev:
-                log.info("Guild %s: added events %s", guild_id, ", ".join(curr - prev))
-            if prev - curr:
-                log.info("Guild %s: removed events %s", guild_id, ", ".join(prev - curr))
-
-            new_cache[guild_id] = events_for_guild
+                to_fetch.append(key)
+
+        async def _event_full(key: str) -> tuple[str, dict | None]:
+            async with sem:
+                return key, await _tba.event_full(self._http, key)
+
+        for key, data in await asyncio.gather(*(_event_full(k) for k in to_fetch)):
+            if data:
+                full_event_data[key] = data
+                log.debug("Fetched full event data for %s", key)
+
+        prev = set(self._active_events)
+        curr = set(full_event_data)
+        if curr - prev:
+            log.info("Added events %s", ", ".join(sorted(curr - prev)))
+        if prev - curr:
+            log.info("Removed events %s", ", ".join(sorted(prev - curr)))
+
+        self._active_events = full_event_data
+        self._event_guilds  = {k: g for k, g in event_guilds.items() if k in full_event_data}
+        for key in prev - curr:
+            for state in (self._next_poll, self._phase, self._last_push,
+                          self._next_reconcile, self._last_matches):
+                state.pop(key, None)
+            self._predictions_due.discard(key)
+
+        # Preload nicknames for every team at newly active events (one call per event),
+        # and again every NICKNAME_REFRESH so they never expire mid-event
+        async def _prefetch(key: str) -> int:
+            async with sem:
+                return await _tba.prefetch_event_nicknames(self._http, key)
+
+        prefetch = [k for k in curr if _tba.event_nicknames_due(k)]
+        for key, count in zip(prefetch, await asyncio.gather(*(_prefetch(k) for k in prefetch))):
+            log.debug("Cached %d nickname(s) for %s", count, key)
+        log.info(
+            "Refreshed events for %d team(s) in %.2fs (%d active event(s), %d fetched, concurrency=%d)",
+            len(all_teams), time.perf_counter() - started,
+            len(full_event_data), len(to_fetch), REFRESH_CONCURRENCY,
+        )
 
-        self._active_events = new_cache
+        # Mark already-played matches at newly active events so they aren't announced
+        await self._seed_events(sem)
+        self._evict_stale()
+        log.info("LiveWatch gauges: %s circuits: %s",
+                 " ".join(f"{k}={v}" for k, v in self.gauges().items()),
+                 " ".join(f"{k}={v}" for k, v in resilience.status().items()))
 
         # Check for newly registered events and announce them
         await self._check_new_event_registrations(all_guild_teams, team_event_map, full_event_data)
@@ -322,66 +579,54 @@ class LiveWatch(commands.Cog):
         full_event_data: dict[str, dict],
     ) -> None:
         """
-        For each guild, compare each team's current TBA event list against
-        known_team_events in the DB.
+        For each guild, compare each team's current TBA event list against the
+        in-memory copy of known_team_events; new keys are persisted in one bulk
+        insert.
 
-        Per-team seeding logic:
+        Per-team logic:
           - known_keys is EMPTY for this team → first time we've seen it
-            (either bot first-run or a new /addteam). Seed silently, no announcement.
+            (either bot first-run or a new /addteam). Record silently, no announcement.
           - known_keys has entries → team was already tracked. Any new_keys are
             genuinely new event registrations → announce them.
+
+        Old results at a new team's events are handled by _seed_events.
         """
+        new_rows: list[tuple[int, str, str]] = []   # (guild_id, team, event_key) to record
+        announce: list[tuple[int, str, str]] = []   # subset that is a genuinely new registration
+
         for guild_id, tracked_teams in all_guild_teams.items():
-            cfg = database.get_config(guild_id)
+            for team in tracked_teams:
+                current_keys = {
+                    ev["key"] for ev in team_event_map.get(team, [])
+                    if isinstance(ev, dict) and isinstance(ev.get("key"), str) and ev["key"]
+                }
+                known_keys = self._known_events.get((guild_id, team), set())
+                new_keys   = current_keys - known_keys
+                if not new_keys:
+                    continue
+                rows = [(guild_id, team, key) for key in sorted(new_keys)]
+                new_rows.extend(rows)
+                # If known_keys is empty this is first-time init → stay silent
+                if known_keys:
+                    announce.extend(rows)
+
+        if not new_rows:
+            return
+        await database.add_known_event_rows(new_rows)
+        for guild_id, team, key in new_rows:
+            self._known_events.setdefault((guild_id, team), set()).add(key)
+
+        for guild_id, team, key in announce:
+            cfg = await database.get_config(guild_id)
             channel = (
                 self.bot.get_channel(cfg["announce_channel_id"])
                 if cfg and cfg.get("announce_channel_id") else None
             )
-
-            for team in tracked_teams:
-                current_keys: set[str] = set()
-                for ev in team_event_map.get(team, []):
-                    if not isinstance(ev, dict):
-                        continue
-                    k = ev.get("key")
-                    if isinstance(k, str) and k:
-                        current_keys.add(k)
-                if not current_keys:
-                    continue
-
-                known_keys = database.get_known_events(guild_id, team)
-                new_keys   = current_keys - known_keys
-
-                if new_keys:
-                    database.add_known_events(guild_id, team, new_keys)
-
-                    # known_keys being non-empty means this team was already
-                    # tracked — so new_keys are genuinely new registrations.
-                    # If known_keys is empty this is first-time init → stay silent.
-                    if known_keys and channel:
-                        for key in new_keys:
-                            ev_data = full_event_data.get(key)
-                            embed   = await self._new_event_embed(team, key, ev_data)
-                            await channel.send(embed=embed)
-                            log.info(
-                                "Guild %s: announced new event %s for team #%s",
-                                guild_id, key, team,
-                            )
-                    elif not known_keys:
-                        # New team — pre-seed all existing played matches so the
-                        # next poll doesn't flood the channel with old results.
-                        seeded = 0
-                        for event_key in current_keys:
-                            matches = await _tba.event_matches(self._http, event_key) or []
-                            for m in matches:
-                                if m.get("winning_alliance") or m.get("actual_time"):
-                                    self._seen_results.add((guild_id, m["key"]))
-                                    seeded += 1
-                        if seeded:
-                            log.info(
-                                "Guild %s: seeded %d existing match(es) for new team #%s",
-                                guild_id, seeded, team,
-                            )
+            if not channel:
+                continue
+            embed = await self._new_event_embed(team, key, full_event_data.get(key))
+            await self._send(guild_id, channel, embed=embed)
+            log.info("Guild %s: announced new event %s for team #%s", guild_id, key, team)
 
     async def _new_event_embed(
         self, team_number: str, event_key: str, event_data: dict | None
@@ -409,6 +654,9 @@ class LiveWatch(commands.Cog):
 
     @tasks.loop(seconds=EVENT_CACHE_INTERVAL)
     async def _refresh_events(self):
+        if _tba.UPSTREAM.breaker.is_open:
+            log.info("Skipping event refresh – TBA circuit open")
+            return
         try:
             await self._do_refresh_events()
         except Exception:
@@ -418,35 +666,179 @@ class LiveWatch(commands.Cog):
     async def _before_refresh(self):
         await self.bot.wait_until_ready()
 
-    # ── Seed already-played matches on startup ────────────────────────────────
+    # ── Bounded state ─────────────────────────────────────────────────────────
 
-    async def _seed_played(self):
-        """Mark all already-completed matches as seen so we don't spam old results."""
-        all_guild_teams = database.get_all_tracked_teams()
+    def _evict_stale(self) -> None:
+        """
+        Drop dedup and ranking state for events that have been inactive for
+        EVICT_AFTER seconds, plus expired shared nicknames.  Events that were never
+        active in this process (e.g. past events restored from the ledger)
+        start their clock at the first eviction pass.
+        """
+        now = time.monotonic()
+        for key in self._active_events:
+            self._event_last_active[key] = now
+
+        referenced = (
+            {_event_of(k) for k, _ in self._seen_upcoming}
+            | {_event_of(k) for k in self._seen_results}
+            | self._seeded_events
+            | set(self._rankings_now)
+            | {_event_of(k) for k in self._predictions}
+        )
+        for key in referenced - set(self._event_last_active):
+            self._event_last_active[key] = now
+
+        stale = {k for k, seen in self._event_last_active.items() if now - seen > EVICT_AFTER}
+        if stale:
+            self._seen_upcoming = {e for e in self._seen_upcoming if _event_of(e[0]) not in stale}
+            self._seen_results  = {k for k in self._seen_results if _event_of(k) not in stale}
+            self._predictions   = {k: p for k, p in self._predictions.items() if _event_of(k) not in stale}
+            self._seeded_events -= stale
+            self._dm.evict(stale)
+            for key in stale:
+                self._rankings_now.pop(key, None)
+                del self._event_last_active[key]
+            log.info("Evicted state for %d inactive event(s)", len(stale))
+
+        _tba.evict_nicknames()
+
+    def gauges(self) -> dict[str, int]:
+        """Current size of every long-lived LiveWatch structure."""
+        return {
+            "active_events":   len(self._active_events),
+            "seen_upcoming":   len(self._seen_upcoming),
+            "seen_results":    len(self._seen_results),
+            "seeded_events":   len(self._seeded_events),
+            "nickname_cache":  _tba.nickname_count(),
+            "rankings_now":    len(self._rankings_now),
+            "predictions":     len(self._predictions),
+            "dm_sent":         len(self._dm),
+            **{f"phase_{p}": n for p, n in collections.Counter(self._phase.values()).items()},
+        }
+
+    # ── Statbotics predictions ────────────────────────────────────────────────
+
+    @tasks.loop(seconds=PREDICTION_INTERVAL)
+    async def _refresh_predictions(self):
+        """
+        Fetch predictions (one call per event) for events whose schedule or
+        results a poll has seen change.  Dormant events wait until they wake up;
+        events without a published schedule are never marked.
+        """
+        if _sbapi.UPSTREAM.breaker.is_open:
+            return
+        due = [
+            k for k in self._predictions_due
+            if k in self._active_events and self._phase.get(k) != "dormant"
+        ]
+        refreshed = 0
+        for event_key in due:
+            try:
+                preds = await _fetch_event_predictions(self._http, event_key)
+            except Exception:
+                log.exception("Error fetching Statbotics predictions for %s", event_key)
+                continue
+            if preds is None:
+                continue   # Statbotics error – retry on the next tick
+            self._predictions_due.discard(event_key)
+            self._predictions.update(preds)
+            refreshed += len(preds)
+        if due:
+            log.debug("Refreshed %d Statbotics prediction(s) for %d event(s)", refreshed, len(due))
+
+    @_refresh_predictions.before_loop
+    async def _before_predictions(self):
+        await self.bot.wait_until_ready()
+
+    def _win_probability(self, match_key: str, side: str) -> tuple[float, str] | tuple[None, None]:
+        """
+        Returns (win_prob, predicted_winner) from the prefetched Statbotics table,
+        or (None, None) if the match has no prediction yet.  Never returns a fake 50%.
+        """
+        pred = self._predictions.get(match_key)
+        if pred is None:
+            return None, None
+        rwp, winner = pred
+        return (rwp if side == "red" else 1 - rwp), winner
+
+    # ── Seed already-played matches at newly active events ────────────────────
+
+    async def _seed_events(self, sem: asyncio.Semaphore):
+        """
+        Mark every already-completed match at an active event we have never
+        seeded as posted, so the first poll doesn't spam old results.
+        Events already in the ledger are skipped, so a restart costs no
+        HTTP calls here.  Results are only polled for seeded events.
+        """
+        pending = [k for k in self._active_events if k not in self._seeded_events]
+        if not pending:
+            return
+
+        async def _matches(key: str) -> tuple[str, list | None]:
+            async with sem:
+                return key, await _tba.event_matches(self._http, key)
+
+        ledger: list[tuple[str, str]] = []
         count = 0
-        for guild_id, events in self._active_events.items():
-            tracked = set(all_guild_teams.get(guild_id, []))
-            for event_key in events:
-                matches = await _tba.event_matches(self._http, event_key) or []
-                for m in matches:
-                    if not m.get("winning_alliance"):
-                        continue
-                    mt = {t[3:] for t in (
-                        m["alliances"]["red"]["team_keys"] +
-                        m["alliances"]["blue"]["team_keys"]
-                    )}
-                    if tracked & mt:
-                        self._seen_results.add((guild_id, m["key"]))
-                        count += 1
-        log.info("Seeded %d already-played match(es)", count)
+        for event_key, matches in await asyncio.gather(*(_matches(k) for k in pending)):
+            if matches is None:
+                continue   # TBA error – retry on the next refresh
+            for m in matches:
+                if _is_completed(m) and m["key"] not in self._seen_results:
+                    self._seen_results.add(m["key"])
+                    ledger.append((m["key"], "result"))
+                    count += 1
+            self._seeded_events.add(event_key)
+            ledger.append((event_key, "seeded"))
+
+        await database.add_posted_alerts(ledger)
+        log.info("Seeded %d already-played match(es) across %d new event(s)", count, len(pending))
 
     # ── Main poll loop ─────────────────────────────────────────────────────────
 
     @tasks.loop(seconds=POLL_INTERVAL)
     async def _poll(self):
         try:
-            await self._poll_upcoming()
-            await self._poll_results()
+            now = time.monotonic()
+            due = [k for k in self._active_events if self._next_poll.get(k, 0) <= now]
+            if not due:
+                return
+            # Each source is skipped only while its own circuit is open; with both
+            # down, leave everything due so the first tick after the cool-down probes
+            tba_down = _tba.UPSTREAM.breaker.is_open
+            if tba_down and _NEXUS.breaker.is_open:
+                log.debug("Skipping poll of %d event(s) – TBA and Nexus circuits open", len(due))
+                return
+            nexus = {} if _NEXUS.breaker.is_open else await self._poll_upcoming(due)
+
+            # With TBA pushing results for an event, polling its matches is only reconciliation
+            results_due = [] if tba_down else [
+                k for k in due
+                if not self._push_active(k) or self._next_reconcile.get(k, 0) <= now
+            ]
+            fetched = await self._poll_results(results_due)
+            for key, matches in fetched.items():
+                if matches and _match_signature(matches) != _match_signature(self._last_matches.get(key)):
+                    self._predictions_due.add(key)
+            self._last_matches.update(fetched)
+            for key in results_due:
+                self._next_reconcile[key] = now + RECONCILE_INTERVAL
+
+            all_guild_teams = await database.get_all_tracked_teams()
+            for key in due:
+                tracked = {t for g in self._event_guilds.get(key, ()) for t in all_guild_teams.get(g, [])}
+                if tba_down:
+                    # Plan on Nexus alone, and come back soon enough to catch up on
+                    # results once TBA recovers
+                    phase, delay = _plan_next_poll(key, tracked, nexus.get(key), None)
+                    delay = min(delay, SLOW_INTERVAL)
+                else:
+                    phase, delay = _plan_next_poll(key, tracked, nexus.get(key), self._last_matches.get(key))
+                if self._phase.get(key) != phase:
+                    log.info("Event %s → %s phase (polling every %ds)", key, phase, delay)
+                self._phase[key]     = phase
+                self._next_poll[key] = now + delay
         except Exception:
             log.exception("Error in LiveWatch poll")
 
@@ -454,34 +846,55 @@ class LiveWatch(commands.Cog):
     async def _before_poll(self):
         await self.bot.wait_until_ready()
 
+    async def _announce_channels(self, guild_ids: set[int]) -> dict[int, discord.abc.Messageable]:
+        """Resolve each guild's configured announce channel, skipping unconfigured guilds."""
+        channels: dict[int, discord.abc.Messageable] = {}
+        for guild_id in guild_ids:
+            cfg = await database.get_config(guild_id)
+            if not cfg or not cfg.get("announce_channel_id"):
+                continue
+            channel = self.bot.get_channel(cfg["announce_channel_id"])
+            if channel:
+                channels[guild_id] = channel
+        return channels
+
+    async def _send(self, guild_id: int, channel: discord.abc.Messageable, **kwargs) -> None:
+        try:
+            await channel.send(**kwargs)
+        except discord.Forbidden:
+            log.warning("Missing permissions to send to channel in guild %s — check bot role permissions", guild_id)
+
     # ── Upcoming matches via Nexus ─────────────────────────────────────────────
 
-    async def _poll_upcoming(self):
+    async def _fetch_nexus(self, tba_key: str) -> dict | None:
+        """Return the Nexus live status for an event, or None if unavailable."""
+        r = await _NEXUS.get(
+            self._http,
+            f"{NEXUS_BASE}/{_nexus_key(tba_key)}",
+            headers={"Nexus-Api-Key": NEXUS_AUTH},
+            ssl=False,
+        )
+        return r.data if r is not None and r.status == 200 else None
+
+    async def _poll_upcoming(self, event_keys: list[str]) -> dict[str, dict]:
+        """Post queue alerts for these events; returns {event_key: nexus_data} fetched."""
         now_ms = int(dt.datetime.now().timestamp() * 1000)
-        all_guild_teams = database.get_all_tracked_teams()
+        all_guild_teams = await database.get_all_tracked_teams()
+        channels = await self._announce_channels(set().union(*self._event_guilds.values()))
+        posted: list[tuple[str, str]] = []
+        fetched: dict[str, dict] = {}
 
-        for guild_id, events in self._active_events.items():
-            tracked = set(all_guild_teams.get(guild_id, []))
-            cfg = database.get_config(guild_id)
-            if not cfg or not cfg.get("announce_channel_id"):
-                continue
-            channel = self.bot.get_channel(cfg["announce_channel_id"])
-            if not channel:
-                continue
+        try:
+            for tba_key in event_keys:
+                event_data = self._active_events[tba_key]
+                guild_ids = [g for g in self._event_guilds.get(tba_key, ()) if g in channels]
+                if not guild_ids:
+                    continue
 
-            for tba_key, event_data in events.items():
-                nexus_k = _nexus_key(tba_key)
-                try:
-                    async with self._http.get(
-                        f"{NEXUS_BASE}/{nexus_k}",
-                        headers={"Nexus-Api-Key": NEXUS_AUTH},
-                        ssl=False,
-                    ) as r:
-                        if r.status != 200:
-                            continue
-                        nexus_data = await r.json()
-                except Exception:
+                nexus_data = await self._fetch_nexus(tba_key)
+                if not nexus_data:
                     continue
+                fetched[tba_key] = nexus_data
 
                 for m in nexus_data.get("matches", []):
                     label      = m.get("label", "")
@@ -493,128 +906,180 @@ class LiveWatch(commands.Cog):
                     if not start_ms or start_ms < now_ms:
                         continue  # already past
 
-                    teams_in_match = tracked & set(red_teams + blue_teams)
-                    if not teams_in_match:
+                    if status == "On deck":
+                        stage, title, minutes_until = "deck", "🛫 On Deck", max(0, (start_ms - now_ms)) // 60_000
+                    elif status == "On field":
+                        stage, title, minutes_until = "field", "🔥 MATCH STARTING NOW", 0
+                    else:
                         continue
 
-                    match_key     = _nexus_label_to_match_key(tba_key, label)
-                    display       = _display_name(event_data)
-                    minutes_until = max(0, (start_ms - now_ms)) // 60_000
+                    match_key = _nexus_label_to_match_key(tba_key, label)
+                    if (match_key, stage) in self._seen_upcoming:
+                        continue
 
-                    if status == "On deck" and (guild_id, nexus_k, label, "deck") not in self._seen_upcoming:
-                        embed = await self._upcoming_embed(
-                            teams_in_match, red_teams, blue_teams,
-                            label, display, tba_key, match_key, minutes_until, "🛫 On Deck"
-                        )
-                        view = _match_view(match_key, _webcast_url(event_data))
-                        try:
-                            await channel.send(embed=embed, view=view)
-                        except discord.Forbidden:
-                            log.warning("Missing permissions to send to channel in guild %s — check bot role permissions", guild_id)
-                        await self._dm_personal_subscribers(teams_in_match, embed, view)
-                        self._seen_upcoming.add((guild_id, nexus_k, label, "deck"))
-
-                    if status == "On field" and (guild_id, nexus_k, label, "field") not in self._seen_upcoming:
-                        embed = await self._upcoming_embed(
-                            teams_in_match, red_teams, blue_teams,
-                            label, display, tba_key, match_key, 0, "🔥 MATCH STARTING NOW"
-                        )
+                    match_teams = set(red_teams + blue_teams)
+                    targets = {
+                        g: frozenset(set(all_guild_teams.get(g, [])) & match_teams)
+                        for g in guild_ids
+                    }
+                    targets = {g: t for g, t in targets.items() if t}
+
+                    if targets:
+                        # Guilds tracking the same teams share one embed
+                        all_teams = frozenset().union(*targets.values())
+                        display   = _display_name(event_data)
+                        embeds: dict[frozenset[str], discord.Embed] = {}
+                        for teams in {*targets.values(), all_teams}:
+                            embeds[teams] = await self._upcoming_embed(
+                                set(teams), red_teams, blue_teams,
+                                label, display, tba_key, match_key, minutes_until, title
+                            )
                         view = _match_view(match_key, _webcast_url(event_data))
-                        try:
-                            await channel.send(embed=embed, view=view)
-                        except discord.Forbidden:
-                            log.warning("Missing permissions to send to channel in guild %s — check bot role permissions", guild_id)
-                        await self._dm_personal_subscribers(teams_in_match, embed, view)
-                        self._seen_upcoming.add((guild_id, nexus_k, label, "field"))
+                        for guild_id, teams in targets.items():
+                            await self._send(guild_id, channels[guild_id], embed=embeds[teams], view=view)
+                        self._dm.dispatch(match_key, stage, set(all_teams), embeds[all_teams], view)
+                        posted.append((match_key, stage))
+
+                    self._seen_upcoming.add((match_key, stage))
+        finally:
+            await database.add_posted_alerts(posted)
+        return fetched
 
     # ── Results via TBA ───────────────────────────────────────────────────────
 
-    async def _poll_results(self):
-        all_guild_teams = database.get_all_tracked_teams()
+    async def _poll_results(self, event_keys: list[str]) -> dict[str, list]:
+        """Post new results for these events; returns {event_key: matches} fetched."""
+        all_guild_teams = await database.get_all_tracked_teams()
+        channels = await self._announce_channels(set().union(*self._event_guilds.values()))
+        posted: list[tuple[str, str]] = []
+        fetched: dict[str, list] = {}
 
-        for guild_id, events in self._active_events.items():
-            tracked = set(all_guild_teams.get(guild_id, []))
-            cfg = database.get_config(guild_id)
-            if not cfg or not cfg.get("announce_channel_id"):
-                continue
-            channel = self.bot.get_channel(cfg["announce_channel_id"])
-            if not channel:
-                continue
-
-            for tba_key, event_data in events.items():
+        try:
+            for tba_key in event_keys:
+                if tba_key not in self._seeded_events:
+                    continue   # old results not marked yet – wait for the next refresh
                 matches = await _tba.event_matches(self._http, tba_key) or []
+                fetched[tba_key] = matches
+                await self._announce_results(tba_key, matches, all_guild_teams, channels, posted)
+        finally:
+            await database.add_posted_alerts(posted)
+        return fetched
 
-                # Fetch fresh rankings once per event per poll tick
-                fresh_ranks = await self._fetch_rankings(tba_key)
-                before_ranks = self._rankings_now.get(tba_key, {})
-                if fresh_ranks:
-                    self._rankings_before[tba_key] = before_ranks
-                    self._rankings_now[tba_key]    = fresh_ranks
+    async def _announce_results(
+        self,
+        tba_key: str,
+        matches: list[dict],
+        all_guild_teams: dict[int, list[str]],
+        channels: dict[int, discord.abc.Messageable],
+        posted: list[tuple[str, str]],
+    ) -> None:
+        """
+        Announce every completed, not-yet-posted match in `matches` to the guilds
+        routed to this event.  Shared by the poll loop and the TBA webhook path;
+        appends a ledger row to `posted` for every completed match it handles, announced
+        or not, for the caller to flush.
+        """
+        event_data = self._active_events[tba_key]
+        guild_ids  = [g for g in self._event_guilds.get(tba_key, ()) if g in channels]
 
-                for m in matches:
-                    if not m.get("winning_alliance"):
-                        continue
-                    key = (guild_id, m["key"])
-                    if key in self._seen_results:
-                        continue
-                    match_teams = {t[3:] for t in (
-                        m["alliances"]["red"]["team_keys"] +
-                        m["alliances"]["blue"]["team_keys"]
-                    )}
-                    teams_in_match = tracked & match_teams
-                    if not teams_in_match:
-                        continue
+        new = [
+            m for m in matches
+            if _is_completed(m) and m["key"] not in self._seen_results
+        ]
+        if not new:
+            return
+        # Oldest first, so rank movement is attributed in play order
+        new.sort(key=lambda m: (m.get("actual_time") or 0, m.get("match_number") or 0))
+
+        # Everyone who just played may have a new EPA shortly
+        epa = self.bot.get_cog("EPA")
+        if epa:
+            epa.schedule_recheck(set().union(*(_match_teams(m) for m in new)))
+
+        # Rankings only move on qualification results; refetch once per event per batch
+        before = self._rankings_now.get(tba_key, {})
+        after  = before
+        if any(m.get("comp_level") == "qm" for m in new):
+            fresh_ranks = await self._fetch_rankings(tba_key)
+            if fresh_ranks:
+                self._rankings_now[tba_key] = after = fresh_ranks
+
+        # With several results in one batch, a team's new rank belongs to its
+        # last match in the batch; earlier matches show no movement for it
+        last_match_of = {t: m["key"] for m in new for t in _match_teams(m)}
+
+        for m in new:
+            if m["key"] in self._seen_results:
+                continue
+            # Claim the match before awaiting anything so a concurrent webhook
+            # delivery and poll can't both announce it
+            self._seen_results.add(m["key"])
+            posted.append((m["key"], "result"))
+
+            match_teams = _match_teams(m)
+            snap_before = {t: r for t, r in before.items() if t in match_teams}
+            snap_after  = {
+                t: r for t, r in after.items() if last_match_of.get(t) == m["key"]
+            }
+
+            targets = {
+                g: frozenset(set(all_guild_teams.get(g, [])) & match_teams)
+                for g in guild_ids
+            }
+            targets = {g: t for g, t in targets.items() if t}
+            if not targets:
+                continue
+
+            all_teams = frozenset().union(*targets.values())
+            embeds = {
+                teams: self._result_embed(
+                    m, set(teams), event_data,
+                    rankings_before=snap_before,
+                    rankings_now=snap_after,
+                )
+                for teams in {*targets.values(), all_teams}
+            }
+            for guild_id, teams in targets.items():
+                await self._send(guild_id, channels[guild_id], embed=embeds[teams])
+            self._dm.dispatch(m["key"], "result", set(all_teams), embeds[all_teams])
+
+    # ── Push ingestion (TBA webhooks, see cogs/webhooks.py) ──────────────────
+
+    def note_push(self, event_key: str) -> None:
+        """Record that TBA pushed something for this event; result polling drops to reconciliation."""
+        if event_key in self._active_events:
+            self._last_push[event_key] = time.monotonic()
+
+    def wake(self, event_key: str) -> None:
+        """Poll this event on the next tick regardless of its phase."""
+        if event_key in self._active_events:
+            self._next_poll[event_key] = 0
+            self._next_reconcile.pop(event_key, None)
+
+    async def ingest_match(self, event_key: str, match: dict) -> None:
+        """Announce a single match result delivered by a TBA match_score webhook."""
+        self.note_push(event_key)
+        if event_key not in self._active_events or event_key not in self._seeded_events:
+            return
+        all_guild_teams = await database.get_all_tracked_teams()
+        channels = await self._announce_channels(self._event_guilds.get(event_key, set()))
+        posted: list[tuple[str, str]] = []
+        unseen = match.get("key") not in self._seen_results
+        try:
+            await self._announce_results(event_key, [match], all_guild_teams, channels, posted)
+        finally:
+            await database.add_posted_alerts(posted)
+        if unseen and match.get("key") in self._seen_results:
+            self._predictions_due.add(event_key)   # a new result moves Statbotics' predictions
 
-                    # Snapshot rankings before this batch, then fetch current
-                    before = self._rankings_before.get(tba_key, {})
-                    current = self._rankings_now.get(tba_key, {})
-
-                    result_embed = self._result_embed(
-                        m, teams_in_match, event_data,
-                        rankings_before=before,
-                        rankings_now=current,
-                    )
-                    try:
-                        await channel.send(embed=result_embed)
-                    except discord.Forbidden:
-                        log.warning("Missing permissions to send to channel in guild %s — check bot role permissions", guild_id)
-                    await self._dm_personal_subscribers(teams_in_match, result_embed)
-                    self._seen_results.add(key)
+    def _push_active(self, event_key: str) -> bool:
+        seen = self._last_push.get(event_key)
+        return seen is not None and time.monotonic() - seen < PUSH_FRESH
 
     # ── Embed builders ────────────────────────────────────────────────────────
 
     async def _team_nickname(self, team_number: str) -> str:
-        if team_number in self._nickname_cache:
-            return self._nickname_cache[team_number]
-        info = await _tba.team_info(self._http, team_number)
-        name = info.get("nickname", f"#{team_number}") if info else f"#{team_number}"
-        self._nickname_cache[team_number] = name
-        return name
-
-    async def _dm_personal_subscribers(
-        self,
-        teams_in_match: set[str],
-        embed: discord.Embed,
-        view: discord.ui.View | None = None,
-    ) -> None:
-        """
-        Find every user who personally subscribes to any team in this match
-        and send them the embed via DM.
-        Silently skips users who have DMs disabled.
-        """
-        notified: set[int] = set()
-        for team in teams_in_match:
-            for user_id in database.get_users_subscribed_to_team(team):
-                if user_id in notified:
-                    continue
-                notified.add(user_id)
-                try:
-                    user = await self.bot.fetch_user(user_id)
-                    await user.send(embed=embed, view=view)
-                except discord.Forbidden:
-                    pass   # user has DMs closed
-                except Exception:
-                    pass
+        return await _tba.team_nickname(self._http, team_number)
 
     async def _upcoming_embed(
         self,
@@ -640,9 +1105,7 @@ class LiveWatch(commands.Cog):
         )
         side_key = "red" if (on_red and not on_blue) else "blue"
 
-        win_prob, winner_pred = await asyncio.get_event_loop().run_in_executor(
-            None, lambda: _win_probability(match_key, side_key)
-        )
+        win_prob, winner_pred = self._win_probability(match_key, side_key)
 
         time_str = f"Starts in ~**{minutes_until} min**" if minutes_until > 0 else "**Starting now!**"
 
@@ -34,11 +34,7 @@ class MyTeams(commands.Cog):
         self._session: aiohttp.ClientSession | None = None
 
     async def cog_load(self):
-        self._session = aiohttp.ClientSession()
-
-    async def cog_unload(self):
-        if self._session:
-            await self._session.close()
+        self._session = self.bot.http_session
 
     # ── /myteam group ─────────────────────────────────────────────────────────
     myteam = app_commands.Group(
@@ -52,7 +48,7 @@ class MyTeams(commands.Cog):
         await interaction.response.defer(ephemeral=True)
 
         # Cap per-user subscriptions
-        current = database.get_user_teams(interaction.user.id)
+        current = await database.get_user_teams(interaction.user.id)
         if len(current) >= MAX_USER_TEAMS:
             await interaction.followup.send(
                 f"⚠️ You can subscribe to at most **{MAX_USER_TEAMS}** teams. "
@@ -68,7 +64,7 @@ class MyTeams(commands.Cog):
             )
             return
 
-        added    = database.add_user_team(interaction.user.id, team_number)
+        added    = await database.add_user_team(interaction.user.id, team_number)
         nickname = info.get("nickname", f"#{team_number}")
 
         if added:
@@ -85,7 +81,7 @@ class MyTeams(commands.Cog):
     @myteam.command(name="remove", description="Unsubscribe from a team")
     @app_commands.describe(team_number="FRC team number, e.g. 5987")
     async def myteam_remove(self, interaction: discord.Interaction, team_number: str):
-        removed = database.remove_user_team(interaction.user.id, team_number)
+        removed = await database.remove_user_team(interaction.user.id, team_number)
         if removed:
             await interaction.response.send_message(
                 f"🗑️ Unsubscribed from team **#{team_number}**.", ephemeral=True
@@ -97,7 +93,7 @@ class MyTeams(commands.Cog):
 
     @myteam.command(name="list", description="See all the teams you're personally subscribed to")
     async def myteam_list(self, interaction: discord.Interaction):
-        teams = database.get_user_teams(interaction.user.id)
+        teams = await database.get_user_teams(interaction.user.id)
         if not teams:
             await interaction.response.send_message(
                 "You have no personal team subscriptions yet.\n"
@@ -120,16 +116,13 @@ class MyTeams(commands.Cog):
 
     @myteam.command(name="clear", description="Remove all your personal team subscriptions")
     async def myteam_clear(self, interaction: discord.Interaction):
-        teams = database.get_user_teams(interaction.user.id)
+        teams = await database.remove_user_teams(interaction.user.id)
         if not teams:
             await interaction.response.send_message(
                 "You have no subscriptions to clear.", ephemeral=True
             )
             return
 
-        for t in teams:
-            database.remove_user_team(interaction.user.id, t)
-
         await interaction.response.send_message(
             f"🗑️ Cleared all **{len(teams)}** personal subscription(s).", ephemeral=True
         )
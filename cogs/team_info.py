@@ -26,11 +26,7 @@ class TeamInfo(commands.Cog):
         self._session: aiohttp.ClientSession | None = None
 
     async def cog_load(self):
-        self._session = aiohttp.ClientSession()
-
-    async def cog_unload(self):
-        if self._session:
-            await self._session.close()
+        self._session = self.bot.http_session
 
     # ── /nextmatch ────────────────────────────────────────────────────────────
     @app_commands.command(
@@ -41,9 +37,9 @@ class TeamInfo(commands.Cog):
         await interaction.response.defer(ephemeral=True)
 
         # Combine personal subscriptions + server tracked teams
-        teams: set[str] = set(database.get_user_teams(interaction.user.id))
+        teams: set[str] = set(await database.get_user_teams(interaction.user.id))
         if interaction.guild:
-            teams |= set(database.get_tracked_teams(interaction.guild_id))
+            teams |= set(await database.get_tracked_teams(interaction.guild_id))
 
         if not teams:
             await interaction.followup.send(
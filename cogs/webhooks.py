@@ -0,0 +1,132 @@
+"""
+cogs/webhooks.py – Optional embedded web server for TBA webhook pushes.
+
+Disabled unless TBA_WEBHOOK_SECRET is set.  When enabled, TBA POSTs to
+http://<host>:<port>/tba/webhook and every payload is verified against the
+X-TBA-HMAC header (HMAC-SHA256 of the raw body, keyed with the secret) before
+being handed to LiveWatch:
+
+  match_score       → LiveWatch.ingest_match()  (result announced immediately)
+  upcoming_match    → LiveWatch.wake()          (poll Nexus/TBA on the next tick)
+  schedule_updated  → LiveWatch.wake()
+  verification      → verification key logged, enter it on thebluealliance.com/account
+
+Environment
+-----------
+TBA_WEBHOOK_SECRET  – secret configured for the webhook on TBA (required to enable)
+TBA_WEBHOOK_PORT    – listen port (falls back to PORT, then 8080)
+
+For local testing, tools/fake_tba_webhook.py signs and sends sample payloads.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import hmac
+import json
+import logging
+import os
+
+from aiohttp import web
+from discord.ext import commands
+
+log = logging.getLogger("webhooks")
+
+WEBHOOK_SECRET = os.environ.get("TBA_WEBHOOK_SECRET", "")
+WEBHOOK_PORT   = int(os.environ.get("TBA_WEBHOOK_PORT") or os.environ.get("PORT") or 8080)
+WEBHOOK_PATH   = "/tba/webhook"
+
+
+def _valid_signature(body: bytes, signature: str) -> bool:
+    expected = hmac.new(WEBHOOK_SECRET.encode(), body, hashlib.sha256).hexdigest()
+    return hmac.compare_digest(expected, signature.strip().lower())
+
+
+def _normalise_match(match: dict) -> dict | None:
+    """
+    Return the pushed match in the shape of TBA's /event/{key}/matches objects,
+    or None if it lacks what the result path needs (LiveWatch then re-polls).
+    """
+    alliances = match.get("alliances") or {}
+    for color in ("red", "blue"):
+        side = alliances.get(color) or {}
+        if "team_keys" not in side and "teams" in side:
+            side["team_keys"] = side["teams"]
+        if "team_keys" not in side or not isinstance(side.get("score"), int) or side["score"] < 0:
+            return None
+    if not match.get("key"):
+        return None
+    # The older payload shape has no winning_alliance; derive it from the
+    # scores ("" is TBA's value for a tie)
+    if "winning_alliance" not in match:
+        red, blue = alliances["red"]["score"], alliances["blue"]["score"]
+        match["winning_alliance"] = "" if red == blue else ("red" if red > blue else "blue")
+    return match
+
+
+class TBAWebhooks(commands.Cog):
+    """Receives TBA webhook pushes and feeds them into LiveWatch."""
+
+    def __init__(self, bot: commands.Bot):
+        self.bot = bot
+        self._runner: web.AppRunner | None = None
+
+    async def cog_load(self):
+        if not WEBHOOK_SECRET:
+            log.info("TBA webhooks disabled (TBA_WEBHOOK_SECRET not set)")
+            return
+        app = web.Application()
+        app.router.add_post(WEBHOOK_PATH, self._handle)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        await web.TCPSite(self._runner, "0.0.0.0", WEBHOOK_PORT).start()
+        log.info("TBA webhook receiver listening on :%d%s", WEBHOOK_PORT, WEBHOOK_PATH)
+
+    async def cog_unload(self):
+        if self._runner:
+            await self._runner.cleanup()
+
+    async def _handle(self, request: web.Request) -> web.Response:
+        body = await request.read()
+        if not _valid_signature(body, request.headers.get("X-TBA-HMAC", "")):
+            log.warning("Rejected TBA webhook with a bad signature from %s", request.remote)
+            return web.Response(status=401)
+        try:
+            payload = json.loads(body)
+        except ValueError:
+            return web.Response(status=400)
+
+        msg_type = payload.get("message_type", "")
+        data     = payload.get("message_data") or {}
+        try:
+            await self._dispatch(msg_type, data)
+        except Exception:
+            log.exception("Error handling TBA webhook %s", msg_type)
+        return web.Response(status=200)
+
+    async def _dispatch(self, msg_type: str, data: dict) -> None:
+        if msg_type == "verification":
+            log.info("TBA webhook verification key: %s", data.get("verification_key"))
+            return
+
+        live = self.bot.get_cog("LiveWatch")
+        event_key = data.get("event_key")
+        if live is None or not event_key:
+            return
+
+        if msg_type == "match_score":
+            match = _normalise_match(data.get("match") or {})
+            if match is None:
+                live.note_push(event_key)
+                live.wake(event_key)
+                return
+            await live.ingest_match(event_key, match)
+        elif msg_type in ("upcoming_match", "schedule_updated"):
+            live.note_push(event_key)
+            live.wake(event_key)
+        else:
+            log.debug("Ignoring TBA webhook %s for %s", msg_type, event_key)
+
+
+async def setup(bot: commands.Bot):
+    await bot.add_cog(TBAWebhooks(bot))
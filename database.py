@@ -1,7 +1,8 @@
 """
 database.py – PostgreSQL persistence layer for the FRC bot.
 
-Uses psycopg2 with a simple connection pool.
+Uses psycopg 3 with an async connection pool, so every query is awaited and
+never blocks the event loop (gateway heartbeats, interactions, poll loops).
 Railway injects DATABASE_URL automatically when a Postgres service is attached.
 
 Tables
@@ -10,26 +11,40 @@ server_config  : per-guild settings (announce channel, admin role)
 tracked_teams  : teams being watched per guild (server-wide, admin-managed)
 user_teams     : teams a specific user personally subscribes to (DM notifications)
 epa_tracking   : teams with EPA change tracking enabled per guild
+known_team_events : event keys already seen per guild/team (new-registration detection)
+posted_alerts  : ledger of live alerts already posted, keyed by match and stage
+tba_archive    : TBA responses for past seasons, which never change (see tba.py)
+bot_state      : small key/value markers the bot keeps across restarts (see app.py)
+schema_version : migrations applied so far (see _MIGRATIONS)
+
+team_number columns are INTEGER; functions here take and return team numbers
+as strings and convert at this layer.
+
+server_config, tracked_teams and user_teams are read on every poll tick, admin
+check and alert but only change through the write functions in this module, so
+they are mirrored in process-local caches: loaded once by init_db() and updated
+write-through.  user_teams is also indexed team → users for DM fan-out.
 """
 
 from __future__ import annotations
 
 import os
 import logging
-from contextlib import contextmanager
+from contextlib import asynccontextmanager
+from typing import Any
 from urllib.parse import urlparse
 
-import psycopg2
-import psycopg2.extras
-import psycopg2.pool
-import psycopg2.errors
+import psycopg.errors
+from psycopg.rows import dict_row
+from psycopg.types.json import Jsonb
+from psycopg_pool import AsyncConnectionPool
 
 log = logging.getLogger("database")
 
 
 def _build_db_kwargs() -> dict:
     """
-    Build psycopg2 connection kwargs.
+    Build psycopg connection kwargs.
 
     Priority order:
       1. Individual PG* env vars — Railway always injects these when a
@@ -86,265 +101,600 @@ def _build_db_kwargs() -> dict:
 
 
 _DB_KWARGS = _build_db_kwargs()
-_pool: psycopg2.pool.SimpleConnectionPool | None = None
+_POOL_MIN = int(os.environ.get("DB_POOL_MIN", "1"))
+_POOL_MAX = int(os.environ.get("DB_POOL_MAX", "10"))
+_pool: AsyncConnectionPool | None = None
 
+# Write-through caches (see module docstring)
+_config_cache:  dict[int, dict]      = {}   # {guild_id: server_config row}
+_tracked_cache: dict[int, list[str]] = {}   # {guild_id: [team_number, ...]}
+_user_cache:    dict[int, list[str]] = {}   # {user_id: [team_number, ...]}
+_subscribers:   dict[str, set[int]]  = {}   # {team_number: {user_id, ...}}
 
-def _get_pool() -> psycopg2.pool.SimpleConnectionPool:
+
+async def _get_pool() -> AsyncConnectionPool:
     global _pool
     if _pool is None:
-        _pool = psycopg2.pool.SimpleConnectionPool(1, 10, **_DB_KWARGS)
-        log.info("DB pool ready → %s:%s/%s", _DB_KWARGS["host"], _DB_KWARGS["port"], _DB_KWARGS["dbname"])
+        pool = AsyncConnectionPool(
+            kwargs=_DB_KWARGS, min_size=_POOL_MIN, max_size=_POOL_MAX, open=False,
+            check=AsyncConnectionPool.check_connection,
+        )
+        await pool.open(wait=True)
+        if _pool is None:
+            _pool = pool
+            log.info("DB pool ready → %s:%s/%s", _DB_KWARGS["host"], _DB_KWARGS["port"], _DB_KWARGS["dbname"])
+        else:
+            await pool.close()   # lost a startup race – keep the first pool
     return _pool
 
 
-@contextmanager
-def _cursor():
-    """Yield a DictCursor and commit/rollback automatically."""
-    pool = _get_pool()
-    conn = pool.getconn()
-    try:
-        conn.autocommit = False
-        with conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cur:
+async def close_db() -> None:
+    """Close the connection pool (call on shutdown)."""
+    global _pool
+    if _pool is not None:
+        await _pool.close()
+        _pool = None
+
+
+@asynccontextmanager
+async def _cursor():
+    """Yield a dict-row cursor; the transaction commits on success, rolls back on error."""
+    pool = await _get_pool()
+    async with pool.connection() as conn:
+        async with conn.cursor(row_factory=dict_row) as cur:
             yield cur
-        conn.commit()
-    except Exception:
-        conn.rollback()
-        raise
-    finally:
-        pool.putconn(conn)
 
 
 # ── Schema ────────────────────────────────────────────────────────────────────
-
-def init_db() -> None:
-    """Create all tables if they don't exist."""
-    with _cursor() as cur:
-        cur.execute("""
-            CREATE TABLE IF NOT EXISTS server_config (
-                guild_id            BIGINT PRIMARY KEY,
-                announce_channel_id BIGINT,
-                admin_role_id       BIGINT
-            )
-        """)
-        cur.execute("""
-            CREATE TABLE IF NOT EXISTS tracked_teams (
-                guild_id    BIGINT NOT NULL,
-                team_number TEXT   NOT NULL,
-                PRIMARY KEY (guild_id, team_number)
-            )
-        """)
-        cur.execute("""
-            CREATE TABLE IF NOT EXISTS user_teams (
-                user_id     BIGINT NOT NULL,
-                team_number TEXT   NOT NULL,
-                PRIMARY KEY (user_id, team_number)
-            )
-        """)
-        cur.execute("""
-            CREATE TABLE IF NOT EXISTS epa_tracking (
-                guild_id    BIGINT NOT NULL,
-                team_number TEXT   NOT NULL,
-                last_epa    FLOAT,
-                PRIMARY KEY (guild_id, team_number)
-            )
-        """)
-        cur.execute("""
-            CREATE TABLE IF NOT EXISTS known_team_events (
-                guild_id    BIGINT NOT NULL,
-                team_number TEXT   NOT NULL,
-                event_key   TEXT   NOT NULL,
-                PRIMARY KEY (guild_id, team_number, event_key)
+#
+# The schema evolves through the numbered steps below.  init_db() applies every
+# step newer than the highest version in schema_version, each in its own
+# transaction together with its schema_version row, so a failing step leaves
+# the database at the previous version.  Never edit a step that has shipped –
+# append a new one.
+
+_MIGRATIONS: list[tuple[int, str, list[str]]] = [
+    (1, "baseline schema", [
+        """
+        CREATE TABLE IF NOT EXISTS server_config (
+            guild_id            BIGINT PRIMARY KEY,
+            announce_channel_id BIGINT,
+            admin_role_id       BIGINT
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS tracked_teams (
+            guild_id    BIGINT NOT NULL,
+            team_number TEXT   NOT NULL,
+            PRIMARY KEY (guild_id, team_number)
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS user_teams (
+            user_id     BIGINT NOT NULL,
+            team_number TEXT   NOT NULL,
+            PRIMARY KEY (user_id, team_number)
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS epa_tracking (
+            guild_id    BIGINT NOT NULL,
+            team_number TEXT   NOT NULL,
+            last_epa    FLOAT,
+            PRIMARY KEY (guild_id, team_number)
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS known_team_events (
+            guild_id    BIGINT NOT NULL,
+            team_number TEXT   NOT NULL,
+            event_key   TEXT   NOT NULL,
+            PRIMARY KEY (guild_id, team_number, event_key)
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS posted_alerts (
+            match_key   TEXT        NOT NULL,
+            stage       TEXT        NOT NULL,
+            posted_at   TIMESTAMPTZ NOT NULL DEFAULT now(),
+            PRIMARY KEY (match_key, stage)
+        )
+        """,
+    ]),
+    # Rows that aren't a plain team number can never match a TBA team key, so
+    # they are dropped rather than blocking the cast.  Spellings that cast to
+    # the same number ("0254" and "254") would collide on the primary key, so
+    # only one row per key survives – the canonical spelling where there is one.
+    (2, "team_number columns to INTEGER", [
+        stmt
+        for table, owner in (
+            ("tracked_teams",     "guild_id"),
+            ("user_teams",        "user_id"),
+            ("epa_tracking",      "guild_id"),
+            ("known_team_events", "guild_id, event_key"),
+        )
+        for stmt in (
+            f"DELETE FROM {table} WHERE team_number !~ '^\\s*[0-9]+\\s*$'",
+            f"""
+            DELETE FROM {table} t USING (
+                SELECT ctid, row_number() OVER (
+                    PARTITION BY {owner}, trim(team_number)::integer
+                    ORDER BY team_number = (trim(team_number)::integer)::text DESC, ctid
+                ) AS n
+                FROM {table}
+            ) d
+            WHERE t.ctid = d.ctid AND d.n > 1
+            """,
+            f"ALTER TABLE {table} ALTER COLUMN team_number TYPE INTEGER "
+            f"USING trim(team_number)::integer",
+        )
+    ]),
+    # The primary keys lead with guild_id / user_id; these serve team → users
+    # (DM fan-out) and team → guilds lookups
+    (3, "indexes for team → users / guilds lookups", [
+        "CREATE INDEX IF NOT EXISTS user_teams_team_idx    ON user_teams (team_number)",
+        "CREATE INDEX IF NOT EXISTS tracked_teams_team_idx ON tracked_teams (team_number)",
+        "CREATE INDEX IF NOT EXISTS epa_tracking_team_idx  ON epa_tracking (team_number)",
+    ]),
+    (4, "tba_archive for past-season TBA responses", [
+        """
+        CREATE TABLE IF NOT EXISTS tba_archive (
+            path       TEXT        NOT NULL,
+            season     INTEGER     NOT NULL,
+            data       JSONB       NOT NULL,
+            fetched_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+            PRIMARY KEY (path, season)
+        )
+        """,
+    ]),
+    (5, "bot_state key/value store", [
+        """
+        CREATE TABLE IF NOT EXISTS bot_state (
+            key        TEXT        PRIMARY KEY,
+            value      TEXT        NOT NULL,
+            updated_at TIMESTAMPTZ NOT NULL DEFAULT now()
+        )
+        """,
+    ]),
+]
+
+# pg_advisory_lock key serialising migrations across instances (rolling deploys)
+_MIGRATION_LOCK = 0x46524342   # "FRCB"
+
+
+async def _migrate() -> int:
+    """Apply pending migrations; returns the resulting schema version."""
+    async with await psycopg.AsyncConnection.connect(**_DB_KWARGS, autocommit=True) as conn:
+        await conn.execute("""
+            CREATE TABLE IF NOT EXISTS schema_version (
+                version     INTEGER     PRIMARY KEY,
+                description TEXT        NOT NULL,
+                applied_at  TIMESTAMPTZ NOT NULL DEFAULT now()
             )
         """)
-    log.info("Database schema ready ✅")
+        await conn.execute("SELECT pg_advisory_lock(%s)", (_MIGRATION_LOCK,))
+        try:
+            cur = await conn.execute("SELECT COALESCE(MAX(version), 0) FROM schema_version")
+            current = (await cur.fetchone())[0]
+            for version, description, statements in _MIGRATIONS:
+                if version <= current:
+                    continue
+                async with conn.transaction():
+                    for stmt in statements:
+                        cur = await conn.execute(stmt)
+                        # Data clean-up steps must never lose rows silently
+                        if (cur.statusmessage or "").startswith("DELETE") and cur.rowcount:
+                            log.warning("Migration %d removed %d row(s) from %s",
+                                        version, cur.rowcount, stmt.split()[2])
+                    await conn.execute(
+                        "INSERT INTO schema_version (version, description) VALUES (%s, %s)",
+                        (version, description),
+                    )
+                log.info("Applied migration %d: %s", version, description)
+                current = version
+        finally:
+            await conn.execute("SELECT pg_advisory_unlock(%s)", (_MIGRATION_LOCK,))
+    return current
+
+
+async def init_db() -> None:
+    """Bring the schema up to date and load the write-through caches."""
+    version = await _migrate()
+    log.info("Database schema ready (version %d) ✅", version)
+    await _load_cache()
+
+
+def _team_id(team_number: str | int) -> int | None:
+    """
+    Column value for a team number.  team_number columns are INTEGER but the
+    public API of this module keeps using strings; None if it isn't a number.
+    """
+    try:
+        return int(str(team_number).strip())
+    except ValueError:
+        return None
+
+
+async def _load_cache() -> None:
+    """Populate the server_config / tracked_teams / user_teams caches from Postgres."""
+    async with _cursor() as cur:
+        await cur.execute("SELECT * FROM server_config")
+        configs = {row["guild_id"]: dict(row) for row in await cur.fetchall()}
+        await cur.execute("SELECT guild_id, team_number FROM tracked_teams")
+        tracked: dict[int, list[str]] = {}
+        for row in await cur.fetchall():
+            tracked.setdefault(row["guild_id"], []).append(str(row["team_number"]))
+        await cur.execute("SELECT user_id, team_number FROM user_teams")
+        user_rows = await cur.fetchall()
+
+    _config_cache.clear()
+    _config_cache.update(configs)
+    _tracked_cache.clear()
+    _tracked_cache.update(tracked)
+    _user_cache.clear()
+    _subscribers.clear()
+    for row in user_rows:
+        _cache_user_team(row["user_id"], str(row["team_number"]))
+    log.info("Cached config for %d guild(s), %d tracked team row(s), %d subscription(s)",
+             len(configs), sum(len(t) for t in tracked.values()), len(user_rows))
 
 
 # ── Server config ─────────────────────────────────────────────────────────────
 
-def get_config(guild_id: int) -> dict | None:
-    with _cursor() as cur:
-        cur.execute("SELECT * FROM server_config WHERE guild_id = %s", (guild_id,))
-        row = cur.fetchone()
+async def get_config(guild_id: int) -> dict | None:
+    row = _config_cache.get(guild_id)
     return dict(row) if row else None
 
 
-def set_announce_channel(guild_id: int, channel_id: int) -> None:
-    with _cursor() as cur:
-        cur.execute("""
+async def set_announce_channel(guild_id: int, channel_id: int) -> None:
+    async with _cursor() as cur:
+        await cur.execute("""
             INSERT INTO server_config (guild_id, announce_channel_id)
             VALUES (%s, %s)
             ON CONFLICT (guild_id) DO UPDATE SET announce_channel_id = EXCLUDED.announce_channel_id
+            RETURNING *
         """, (guild_id, channel_id))
+        row = await cur.fetchone()
+    _config_cache[guild_id] = dict(row)
 
 
-def set_admin_role(guild_id: int, role_id: int) -> None:
-    with _cursor() as cur:
-        cur.execute("""
+async def set_admin_role(guild_id: int, role_id: int) -> None:
+    async with _cursor() as cur:
+        await cur.execute("""
             INSERT INTO server_config (guild_id, admin_role_id)
             VALUES (%s, %s)
             ON CONFLICT (guild_id) DO UPDATE SET admin_role_id = EXCLUDED.admin_role_id
+            RETURNING *
         """, (guild_id, role_id))
+        row = await cur.fetchone()
+    _config_cache[guild_id] = dict(row)
 
 
 # ── Tracked teams ─────────────────────────────────────────────────────────────
 
-def add_tracked_team(guild_id: int, team_number: str) -> bool:
+async def add_tracked_team(guild_id: int, team_number: str) -> bool:
     """Returns True if newly added, False if already tracked."""
+    team = _team_id(team_number)
+    if team is None:
+        return False
     try:
-        with _cursor() as cur:
-            cur.execute(
+        async with _cursor() as cur:
+            await cur.execute(
                 "INSERT INTO tracked_teams (guild_id, team_number) VALUES (%s, %s)",
-                (guild_id, str(team_number)),
+                (guild_id, team),
             )
-        return True
-    except psycopg2.errors.UniqueViolation:
+    except psycopg.errors.UniqueViolation:
         return False
-
-
-def remove_tracked_team(guild_id: int, team_number: str) -> bool:
-    with _cursor() as cur:
-        cur.execute(
+    _tracked_cache.setdefault(guild_id, []).append(str(team))
+    return True
+
+
+async def add_tracked_teams(guild_id: int, team_numbers: list[str]) -> list[str]:
+    """Track many teams in one statement. Returns the ones that were newly added, in input order."""
+    teams = list(dict.fromkeys(t for t in map(_team_id, team_numbers) if t is not None))
+    if not teams:
+        return []
+    async with _cursor() as cur:
+        await cur.execute("""
+            INSERT INTO tracked_teams (guild_id, team_number)
+            SELECT %s, t FROM unnest(%s::integer[]) AS t
+            ON CONFLICT DO NOTHING
+            RETURNING team_number
+        """, (guild_id, teams))
+        inserted = {r["team_number"] for r in await cur.fetchall()}
+    added = [str(t) for t in teams if t in inserted]
+    if added:
+        _tracked_cache.setdefault(guild_id, []).extend(added)
+    return added
+
+
+async def remove_tracked_team(guild_id: int, team_number: str) -> bool:
+    team = _team_id(team_number)
+    if team is None:
+        return False
+    async with _cursor() as cur:
+        await cur.execute(
             "DELETE FROM tracked_teams WHERE guild_id = %s AND team_number = %s",
-            (guild_id, str(team_number)),
+            (guild_id, team),
         )
-        return cur.rowcount > 0
+        removed = cur.rowcount > 0
+    if removed:
+        teams = _tracked_cache.get(guild_id, [])
+        if str(team) in teams:
+            teams.remove(str(team))
+        if not teams:
+            _tracked_cache.pop(guild_id, None)
+    return removed
 
 
-def get_tracked_teams(guild_id: int) -> list[str]:
-    with _cursor() as cur:
-        cur.execute(
-            "SELECT team_number FROM tracked_teams WHERE guild_id = %s", (guild_id,)
-        )
-        return [r["team_number"] for r in cur.fetchall()]
+async def get_tracked_teams(guild_id: int) -> list[str]:
+    return list(_tracked_cache.get(guild_id, ()))
 
 
-def get_all_tracked_teams() -> dict[int, list[str]]:
-    with _cursor() as cur:
-        cur.execute("SELECT guild_id, team_number FROM tracked_teams")
-        result: dict[int, list[str]] = {}
-        for row in cur.fetchall():
-            result.setdefault(row["guild_id"], []).append(row["team_number"])
-    return result
+async def get_all_tracked_teams() -> dict[int, list[str]]:
+    return {guild_id: list(teams) for guild_id, teams in _tracked_cache.items()}
 
 
 # ── EPA tracking ──────────────────────────────────────────────────────────────
 
-def add_epa_tracking(guild_id: int, team_number: str, current_epa: float | None = None) -> bool:
+async def add_epa_tracking(guild_id: int, team_number: str, current_epa: float | None = None) -> bool:
+    team = _team_id(team_number)
+    if team is None:
+        return False
     try:
-        with _cursor() as cur:
-            cur.execute(
+        async with _cursor() as cur:
+            await cur.execute(
                 "INSERT INTO epa_tracking (guild_id, team_number, last_epa) VALUES (%s, %s, %s)",
-                (guild_id, str(team_number), current_epa),
+                (guild_id, team, current_epa),
             )
         return True
-    except psycopg2.errors.UniqueViolation:
+    except psycopg.errors.UniqueViolation:
         return False
 
 
-def remove_epa_tracking(guild_id: int, team_number: str) -> bool:
-    with _cursor() as cur:
-        cur.execute(
+async def remove_epa_tracking(guild_id: int, team_number: str) -> bool:
+    team = _team_id(team_number)
+    if team is None:
+        return False
+    async with _cursor() as cur:
+        await cur.execute(
             "DELETE FROM epa_tracking WHERE guild_id = %s AND team_number = %s",
-            (guild_id, str(team_number)),
+            (guild_id, team),
         )
         return cur.rowcount > 0
 
 
-def get_epa_tracked_teams(guild_id: int) -> list[dict]:
-    with _cursor() as cur:
-        cur.execute(
-            "SELECT team_number, last_epa FROM epa_tracking WHERE guild_id = %s", (guild_id,)
+async def get_epa_tracked_teams(guild_id: int) -> list[dict]:
+    async with _cursor() as cur:
+        await cur.execute(
+            "SELECT team_number::text, last_epa FROM epa_tracking WHERE guild_id = %s", (guild_id,)
         )
-        return [dict(r) for r in cur.fetchall()]
+        return [dict(r) for r in await cur.fetchall()]
 
 
-def update_last_epa(guild_id: int, team_number: str, epa: float) -> None:
-    with _cursor() as cur:
-        cur.execute(
+async def update_last_epa(guild_id: int, team_number: str, epa: float) -> None:
+    async with _cursor() as cur:
+        await cur.execute(
             "UPDATE epa_tracking SET last_epa = %s WHERE guild_id = %s AND team_number = %s",
-            (epa, guild_id, str(team_number)),
+            (epa, guild_id, _team_id(team_number)),
         )
 
 
-def get_all_epa_tracked() -> dict[int, list[dict]]:
-    with _cursor() as cur:
-        cur.execute("SELECT guild_id, team_number, last_epa FROM epa_tracking")
+async def update_last_epas(updates: list[tuple[int, str, float]]) -> None:
+    """Apply many (guild_id, team_number, epa) baseline updates in one statement."""
+    if not updates:
+        return
+    guild_ids, teams, epas = zip(*updates)
+    async with _cursor() as cur:
+        await cur.execute("""
+            UPDATE epa_tracking AS t SET last_epa = u.epa
+            FROM unnest(%s::bigint[], %s::integer[], %s::float8[]) AS u(guild_id, team_number, epa)
+            WHERE t.guild_id = u.guild_id AND t.team_number = u.team_number
+        """, (list(guild_ids), [_team_id(t) for t in teams], list(epas)))
+
+
+async def get_all_epa_tracked() -> dict[int, list[dict]]:
+    async with _cursor() as cur:
+        await cur.execute("SELECT guild_id, team_number::text, last_epa FROM epa_tracking")
         result: dict[int, list[dict]] = {}
-        for row in cur.fetchall():
+        for row in await cur.fetchall():
             result.setdefault(row["guild_id"], []).append(dict(row))
     return result
 
 
 # ── User personal team subscriptions ─────────────────────────────────────────
 
-def add_user_team(user_id: int, team_number: str) -> bool:
+def _cache_user_team(user_id: int, team_number: str) -> None:
+    _user_cache.setdefault(user_id, []).append(team_number)
+    _subscribers.setdefault(team_number, set()).add(user_id)
+
+
+def _uncache_user_team(user_id: int, team_number: str) -> None:
+    teams = _user_cache.get(user_id, [])
+    if team_number in teams:
+        teams.remove(team_number)
+    if not teams:
+        _user_cache.pop(user_id, None)
+    users = _subscribers.get(team_number, set())
+    users.discard(user_id)
+    if not users:
+        _subscribers.pop(team_number, None)
+
+
+async def add_user_team(user_id: int, team_number: str) -> bool:
+    team = _team_id(team_number)
+    if team is None:
+        return False
     try:
-        with _cursor() as cur:
-            cur.execute(
+        async with _cursor() as cur:
+            await cur.execute(
                 "INSERT INTO user_teams (user_id, team_number) VALUES (%s, %s)",
-                (user_id, str(team_number)),
+                (user_id, team),
             )
-        return True
-    except psycopg2.errors.UniqueViolation:
+    except psycopg.errors.UniqueViolation:
         return False
+    _cache_user_team(user_id, str(team))
+    return True
 
 
-def remove_user_team(user_id: int, team_number: str) -> bool:
-    with _cursor() as cur:
-        cur.execute(
+async def remove_user_team(user_id: int, team_number: str) -> bool:
+    team = _team_id(team_number)
+    if team is None:
+        return False
+    async with _cursor() as cur:
+        await cur.execute(
             "DELETE FROM user_teams WHERE user_id = %s AND team_number = %s",
-            (user_id, str(team_number)),
+            (user_id, team),
         )
-        return cur.rowcount > 0
+        removed = cur.rowcount > 0
+    if removed:
+        _uncache_user_team(user_id, str(team))
+    return removed
 
 
-def get_user_teams(user_id: int) -> list[str]:
-    with _cursor() as cur:
-        cur.execute(
-            "SELECT team_number FROM user_teams WHERE user_id = %s", (user_id,)
-        )
-        return [r["team_number"] for r in cur.fetchall()]
+async def remove_user_teams(user_id: int, team_numbers: list[str] | None = None) -> list[str]:
+    """
+    Remove many subscriptions in one statement – all of the user's teams when
+    `team_numbers` is None.  Returns the teams that were actually removed.
+    """
+    async with _cursor() as cur:
+        if team_numbers is None:
+            await cur.execute(
+                "DELETE FROM user_teams WHERE user_id = %s RETURNING team_number", (user_id,)
+            )
+        else:
+            await cur.execute(
+                "DELETE FROM user_teams WHERE user_id = %s AND team_number = ANY(%s) RETURNING team_number",
+                (user_id, [t for t in map(_team_id, team_numbers) if t is not None]),
+            )
+        removed = [str(r["team_number"]) for r in await cur.fetchall()]
+    for team in removed:
+        _uncache_user_team(user_id, team)
+    return removed
 
 
-def get_all_user_teams() -> dict[int, list[str]]:
-    with _cursor() as cur:
-        cur.execute("SELECT user_id, team_number FROM user_teams")
-        result: dict[int, list[str]] = {}
-        for row in cur.fetchall():
-            result.setdefault(row["user_id"], []).append(row["team_number"])
-    return result
+async def get_user_teams(user_id: int) -> list[str]:
+    return list(_user_cache.get(user_id, ()))
 
 
-def get_users_subscribed_to_team(team_number: str) -> list[int]:
-    with _cursor() as cur:
-        cur.execute(
-            "SELECT user_id FROM user_teams WHERE team_number = %s", (str(team_number),)
-        )
-        return [r["user_id"] for r in cur.fetchall()]
+async def get_all_user_teams() -> dict[int, list[str]]:
+    return {user_id: list(teams) for user_id, teams in _user_cache.items()}
+
+
+async def get_users_subscribed_to_team(team_number: str) -> list[int]:
+    return list(_subscribers.get(str(team_number), ()))
+
+
+async def subscribers_for_teams(team_numbers: set[str]) -> set[int]:
+    """Every user subscribed to any of these teams, straight from the in-memory index."""
+    users: set[int] = set()
+    for team in team_numbers:
+        users |= _subscribers.get(str(team), set())
+    return users
+
 
 # ── Known team events (new event registration detection) ─────────────────────
 
-def get_known_events(guild_id: int, team_number: str) -> set[str]:
+async def get_known_events(guild_id: int, team_number: str) -> set[str]:
     """Return the set of event keys already known for this team in this guild."""
-    with _cursor() as cur:
-        cur.execute(
+    async with _cursor() as cur:
+        await cur.execute(
             "SELECT event_key FROM known_team_events WHERE guild_id = %s AND team_number = %s",
-            (guild_id, str(team_number)),
+            (guild_id, _team_id(team_number)),
+        )
+        return {r["event_key"] for r in await cur.fetchall()}
+
+
+async def get_all_known_events() -> dict[tuple[int, str], set[str]]:
+    """Return {(guild_id, team_number): known event keys} for every guild in one query."""
+    async with _cursor() as cur:
+        await cur.execute("SELECT guild_id, team_number::text, event_key FROM known_team_events")
+        result: dict[tuple[int, str], set[str]] = {}
+        for row in await cur.fetchall():
+            result.setdefault((row["guild_id"], row["team_number"]), set()).add(row["event_key"])
+    return result
+
+
+async def add_known_events(guild_id: int, team_number: str, event_keys: set[str]) -> None:
+    """Mark these event keys as known in one statement (no-op if already present)."""
+    await add_known_event_rows([(guild_id, team_number, key) for key in event_keys])
+
+
+async def add_known_event_rows(rows: list[tuple[int, str, str]]) -> None:
+    """Record many (guild_id, team_number, event_key) rows in one statement (no-op if present)."""
+    rows = [(g, t, k) for g, team, k in rows if (t := _team_id(team)) is not None]
+    if not rows:
+        return
+    guild_ids, teams, keys = zip(*rows)
+    async with _cursor() as cur:
+        await cur.execute("""
+            INSERT INTO known_team_events (guild_id, team_number, event_key)
+            SELECT * FROM unnest(%s::bigint[], %s::integer[], %s::text[])
+            ON CONFLICT DO NOTHING
+        """, (list(guild_ids), list(teams), list(keys)))
+
+
+# ── Posted alert ledger (live alert dedup across restarts) ───────────────────
+
+async def get_posted_alerts(season: int) -> set[tuple[str, str]]:
+    """Return every (match_key, stage) already posted for this season's events."""
+    async with _cursor() as cur:
+        await cur.execute(
+            "SELECT match_key, stage FROM posted_alerts WHERE match_key LIKE %s",
+            (f"{season}%",),
         )
-        return {r["event_key"] for r in cur.fetchall()}
+        return {(r["match_key"], r["stage"]) for r in await cur.fetchall()}
 
 
-def add_known_events(guild_id: int, team_number: str, event_keys: set[str]) -> None:
-    """Mark these event keys as known (no-op if already present)."""
-    if not event_keys:
+async def add_posted_alerts(alerts: list[tuple[str, str]]) -> None:
+    """Record (match_key, stage) pairs as posted in one statement (no-op if present)."""
+    if not alerts:
         return
-    with _cursor() as cur:
-        for key in event_keys:
-            cur.execute("""
-                INSERT INTO known_team_events (guild_id, team_number, event_key)
-                VALUES (%s, %s, %s)
-                ON CONFLICT DO NOTHING
-            """, (guild_id, str(team_number), key))
+    match_keys, stages = zip(*alerts)
+    async with _cursor() as cur:
+        await cur.execute("""
+            INSERT INTO posted_alerts (match_key, stage)
+            SELECT * FROM unnest(%s::text[], %s::text[])
+            ON CONFLICT DO NOTHING
+        """, (list(match_keys), list(stages)))
+
+
+# ── TBA archive (past-season responses, see tba.py) ──────────────────────────
+
+async def get_tba_archive(path: str, season: int) -> Any | None:
+    """Return the archived TBA response for (path, season), or None if not archived."""
+    async with _cursor() as cur:
+        await cur.execute(
+            "SELECT data FROM tba_archive WHERE path = %s AND season = %s",
+            (path, season),
+        )
+        row = await cur.fetchone()
+    return row["data"] if row else None
+
+
+async def put_tba_archive(path: str, season: int, data: Any) -> None:
+    """Archive a TBA response for (path, season), replacing any earlier copy."""
+    async with _cursor() as cur:
+        await cur.execute("""
+            INSERT INTO tba_archive (path, season, data)
+            VALUES (%s, %s, %s)
+            ON CONFLICT (path, season)
+            DO UPDATE SET data = EXCLUDED.data, fetched_at = now()
+        """, (path, season, Jsonb(data)))
+
+
+# ── Bot state (markers kept across restarts) ─────────────────────────────────
 
+async def get_bot_state(key: str) -> str | None:
+    async with _cursor() as cur:
+        await cur.execute("SELECT value FROM bot_state WHERE key = %s", (key,))
+        row = await cur.fetchone()
+    return row["value"] if row else None
 
 
+async def set_bot_state(key: str, value: str) -> None:
+    async with _cursor() as cur:
+        await cur.execute("""
+            INSERT INTO bot_state (key, value) VALUES (%s, %s)
+            ON CONFLICT (key) DO UPDATE SET value = EXCLUDED.value, updated_at = now()
+        """, (key, value))
@@ -0,0 +1,41 @@
+"""
+http_client.py – the bot-wide aiohttp session.
+
+app.py creates one session before loading extensions and attaches it as
+`bot.http_session`; every cog, tba.py and statbotics_api.py calls go through
+it.  One connector means keep-alive connections (and TLS sessions) to TBA,
+Nexus and Statbotics are shared instead of being opened once per cog, DNS
+lookups are cached, and every request has a deadline so a hung upstream can
+never stall a poll tick indefinitely.
+"""
+
+from __future__ import annotations
+
+import os
+
+import aiohttp
+
+HTTP_LIMIT          = int(os.environ.get("HTTP_LIMIT", "100"))           # open connections in total
+HTTP_LIMIT_PER_HOST = int(os.environ.get("HTTP_LIMIT_PER_HOST", "10"))   # open connections per host
+DNS_CACHE_TTL       = 300   # seconds a resolved hostname is reused
+KEEPALIVE_TIMEOUT   = 60    # seconds an idle connection is kept for reuse
+
+# Default deadline for every request; individual calls may pass a tighter one
+TIMEOUT = aiohttp.ClientTimeout(total=20, connect=5, sock_read=15)
+
+USER_AGENT = "frcbot"
+
+
+def create_session() -> aiohttp.ClientSession:
+    """Build the shared session; must be called from inside the running event loop."""
+    connector = aiohttp.TCPConnector(
+        limit=HTTP_LIMIT,
+        limit_per_host=HTTP_LIMIT_PER_HOST,
+        ttl_dns_cache=DNS_CACHE_TTL,
+        keepalive_timeout=KEEPALIVE_TIMEOUT,
+    )
+    return aiohttp.ClientSession(
+        connector=connector,
+        timeout=TIMEOUT,
+        headers={"User-Agent": USER_AGENT},
+    )
@@ -0,0 +1,191 @@
+"""
+resilience.py – client-side protection for the upstream APIs (TBA, Nexus, Statbotics).
+
+Every upstream gets an Upstream object that wraps its GET requests with:
+
+  • a token bucket, so bursts (event refreshes, many due events in one tick)
+    are spread out instead of fired at once
+  • retries on timeouts, connection errors, 429 and 5xx with exponential
+    backoff and full jitter, honouring Retry-After
+  • a circuit breaker: after FAILURE_THRESHOLD consecutive failed requests the
+    upstream is treated as down for reset_after seconds and calls return None
+    immediately; the first call after that is a single probe that either
+    closes the breaker or re-opens it
+
+Callers still see "None on error", so nothing downstream changes shape; loops
+that can skip a whole cycle check `breaker.is_open` first.  status() exposes
+every breaker's state for logs and gauges.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import random
+import time
+from typing import Any, NamedTuple
+
+import aiohttp
+
+log = logging.getLogger("resilience")
+
+FAILURE_THRESHOLD = 5      # consecutive failed requests before the breaker opens
+MAX_RETRY_WAIT    = 10     # seconds; a longer Retry-After opens the breaker instead of waiting inline
+
+CLOSED, OPEN, HALF_OPEN = "closed", "open", "half_open"
+
+
+class Response(NamedTuple):
+    status:  int
+    headers: Any           # the response's CIMultiDictProxy
+    data:    Any | None    # parsed JSON for a 200, otherwise None
+
+
+class TokenBucket:
+    """Allow `rate` requests per second on average, with bursts of up to `burst`."""
+
+    def __init__(self, rate: float, burst: int):
+        self.rate  = rate
+        self.burst = burst
+        self._tokens  = float(burst)
+        self._updated = time.monotonic()
+        self._lock    = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens  = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+class CircuitBreaker:
+    """Consecutive-failure breaker with a timed open state and a single half-open probe."""
+
+    def __init__(self, name: str, reset_after: float):
+        self.name        = name
+        self.reset_after = reset_after
+        self.state       = CLOSED
+        self._failures   = 0
+        self._open_until = 0.0
+
+    @property
+    def is_open(self) -> bool:
+        """True while the upstream is considered down and not yet due for a probe."""
+        return self.state == OPEN and time.monotonic() < self._open_until
+
+    def allow(self) -> bool:
+        if self.state == CLOSED:
+            return True
+        now = time.monotonic()
+        if now >= self._open_until:
+            # Let exactly this call through as the probe; if it never reports back
+            # (e.g. cancelled), another probe is allowed after reset_after
+            self.state       = HALF_OPEN
+            self._open_until = now + self.reset_after
+            log.info("%s circuit half-open – probing", self.name)
+            return True
+        return False
+
+    def record_success(self) -> None:
+        if self.state != CLOSED:
+            log.info("%s circuit closed – upstream recovered", self.name)
+        self.state     = CLOSED
+        self._failures = 0
+
+    def record_failure(self) -> None:
+        self._failures += 1
+        if self.state == HALF_OPEN or self._failures >= FAILURE_THRESHOLD:
+            self.trip(self.reset_after)
+
+    def trip(self, seconds: float) -> None:
+        """Open the breaker for `seconds` (at least until any current opening ends)."""
+        if self.state != OPEN:
+            log.warning("%s circuit open for %.0fs", self.name, seconds)
+        until = time.monotonic() + seconds
+        if self.state != OPEN or until > self._open_until:
+            self._open_until = until
+        self.state = OPEN
+
+
+def _retry_after(headers) -> float | None:
+    """Seconds from a numeric Retry-After header, if present."""
+    try:
+        return max(0.0, float(headers.get("Retry-After", "")))
+    except ValueError:
+        return None
+
+
+class Upstream:
+    """Rate-limited, retrying, circuit-broken GETs against one upstream API."""
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        rate: float,
+        burst: int,
+        retries: int = 2,
+        backoff: float = 0.5,
+        reset_after: float = 60,
+    ):
+        self.name    = name
+        self.bucket  = TokenBucket(rate, burst)
+        self.breaker = CircuitBreaker(name, reset_after)
+        self.retries = retries
+        self.backoff = backoff
+        _upstreams[name] = self
+
+    async def get(self, session: aiohttp.ClientSession, url: str, **kwargs) -> Response | None:
+        """
+        GET `url`.  Returns the final Response (any status; data parsed only for a
+        200), or None when the breaker is open or every attempt failed to connect.
+        429 / 5xx responses that survive all retries count as a failure.
+        """
+        if not self.breaker.allow():
+            return None
+
+        for attempt in range(self.retries + 1):
+            await self.bucket.acquire()
+            wait: float | None = None
+            try:
+                async with session.get(url, **kwargs) as r:
+                    if r.status != 429 and r.status < 500:
+                        data = await r.json() if r.status == 200 else None
+                        self.breaker.record_success()
+                        return Response(r.status, r.headers, data)
+                    result: Response | None = Response(r.status, r.headers, None)
+                    reason = f"HTTP {r.status}"
+                    wait   = _retry_after(r.headers)
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                result = None
+                reason = type(e).__name__
+
+            if wait is not None and wait > MAX_RETRY_WAIT:
+                # The upstream asked for a long pause – honour it without stalling the caller
+                self.breaker.trip(wait)
+                log.warning("%s asked to retry after %.0fs (%s)", self.name, wait, url)
+                return result
+            if attempt == self.retries:
+                break
+            if wait is None:
+                wait = random.uniform(0, self.backoff * 2 ** attempt)   # full jitter
+            log.debug("%s %s failed (%s); retry %d in %.2fs", self.name, url, reason, attempt + 1, wait)
+            await asyncio.sleep(wait)
+
+        self.breaker.record_failure()
+        log.warning("%s %s failed after %d attempt(s): %s", self.name, url, self.retries + 1, reason)
+        return result
+
+
+# {name: Upstream} – every upstream created in this process
+_upstreams: dict[str, Upstream] = {}
+
+
+def status() -> dict[str, str]:
+    """Circuit state of every upstream, e.g. {"tba": "closed", "nexus": "open"}."""
+    return {name: u.breaker.state for name, u in _upstreams.items()}
@@ -0,0 +1,139 @@
+"""
+statbotics_api.py – thin async wrapper around the Statbotics v3 REST API.
+
+Replaces the synchronous `statbotics` client, whose blocking calls had to be
+pushed through the default executor that discord.py also relies on.  Calls go
+through the caller's pooled aiohttp session with a per-request timeout, the
+rate limit / retry / circuit breaker of resilience.Upstream, and a short-lived
+response cache so /trackepa, EPA rechecks and the predictions loop don't
+refetch the same rows.
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Any
+
+import aiohttp
+
+import resilience
+
+BASE = "https://api.statbotics.io/v3"
+
+REQUEST_TIMEOUT   = aiohttp.ClientTimeout(total=15, connect=5)
+CACHE_TTL         = 120    # seconds a response is served without refetching
+CACHE_MAX_ENTRIES = 1024   # oldest entries are dropped beyond this
+PAGE_SIZE         = 1000   # Statbotics' maximum page size
+LEADERBOARD_TTL   = 3600   # seconds a season leaderboard is served before rebuilding
+
+# Rate limit, retries with backoff and a circuit breaker (see resilience.py)
+UPSTREAM = resilience.Upstream("statbotics", rate=5, burst=10)
+
+# {url_with_query: (expires_at, data)} – insertion order doubles as LRU order
+_cache: dict[str, tuple[float, Any]] = {}
+
+# {year: (expires_at, [(team_number, epa), ...] sorted by EPA, best first)}
+_leaderboards: dict[int, tuple[float, list[tuple[str, float]]]] = {}
+
+
+def _cache_key(path: str, params: dict | None) -> str:
+    if not params:
+        return path
+    return path + "?" + "&".join(f"{k}={v}" for k, v in sorted(params.items()))
+
+
+async def get(session: aiohttp.ClientSession, path: str, params: dict | None = None) -> Any | None:
+    """
+    GET /path from Statbotics.  Returns parsed JSON or None on error.
+
+    The returned object may be shared with other callers through the cache –
+    treat it as read-only.
+    """
+    path = path.lstrip("/")
+    key  = _cache_key(path, params)
+    now  = time.monotonic()
+    cached = _cache.get(key)
+    if cached and cached[0] > now:
+        return cached[1]
+
+    r = await UPSTREAM.get(session, f"{BASE}/{path}", params=params, timeout=REQUEST_TIMEOUT)
+    if r is None or r.status != 200:
+        return None
+    data = r.data
+
+    _cache.pop(key, None)
+    _cache[key] = (time.monotonic() + CACHE_TTL, data)
+    while len(_cache) > CACHE_MAX_ENTRIES:
+        _cache.pop(next(iter(_cache)))
+    return data
+
+
+def epa_mean(row: dict | None) -> float | None:
+    """Mean total-points EPA from a team-year object, if present."""
+    epa = (row or {}).get("epa") or {}
+    if not isinstance(epa, dict):
+        return None
+    total = epa.get("total_points")
+    if isinstance(total, dict) and total.get("mean") is not None:
+        return float(total["mean"])
+    return float(epa["mean"]) if epa.get("mean") is not None else None
+
+
+async def team_year(session: aiohttp.ClientSession, team_number: str, year: int) -> dict | None:
+    return await get(session, f"team_year/{team_number}/{year}")
+
+
+async def team_years(
+    session: aiohttp.ClientSession, year: int, limit: int = PAGE_SIZE, offset: int = 0,
+) -> list | None:
+    return await get(session, "team_years", {"year": year, "limit": limit, "offset": offset})
+
+
+async def season_team_years(session: aiohttp.ClientSession, year: int) -> list | None:
+    """
+    Every team-year of a season, read page by page.  Returns None if any page
+    fails, so callers never act on a partial season.
+    """
+    rows: list = []
+    offset = 0
+    while True:
+        page = await team_years(session, year, PAGE_SIZE, offset)
+        if page is None:
+            return None
+        rows.extend(page)
+        if len(page) < PAGE_SIZE:
+            return rows
+        offset += PAGE_SIZE
+
+
+async def refresh_leaderboard(session: aiohttp.ClientSession, year: int) -> list[tuple[str, float]] | None:
+    """Rebuild the season's EPA leaderboard from a full team-year sweep (None on error)."""
+    rows = await season_team_years(session, year)
+    if rows is None:
+        return None
+    board = sorted(
+        ((str(row["team"]), epa) for row in rows
+         if row.get("team") is not None and (epa := epa_mean(row)) is not None),
+        key=lambda entry: entry[1],
+        reverse=True,
+    )
+    _leaderboards[year] = (time.monotonic() + LEADERBOARD_TTL, board)
+    return board
+
+
+async def leaderboard(session: aiohttp.ClientSession, year: int) -> list[tuple[str, float]] | None:
+    """
+    [(team_number, epa), ...] for a season, best first.  Served from memory while
+    fresh; if a rebuild fails the previous leaderboard is returned instead.
+    """
+    cached = _leaderboards.get(year)
+    if cached and cached[0] > time.monotonic():
+        return cached[1]
+    board = await refresh_leaderboard(session, year)
+    if board is None and cached:
+        return cached[1]
+    return board
+
+
+async def event_matches(session: aiohttp.ClientSession, event_key: str) -> list | None:
+    return await get(session, "matches", {"event": event_key, "limit": PAGE_SIZE})
@@ -1,15 +1,40 @@
 """
 tba.py – thin async wrapper around The Blue Alliance v3 API.
+
+Responses are cached per path.  Within the Cache-Control max-age TBA sends we
+serve the cached body without touching the network; after that the request is
+revalidated with If-None-Match and a 304 reuses the cached body, so unchanged
+match lists and rankings are neither re-downloaded nor re-parsed.  Concurrent
+requests for the same path are coalesced into one upstream call.  Requests
+are rate limited, retried and circuit-broken through resilience.Upstream; while
+TBA is failing, an expired cached body is served rather than nothing.
+
+Responses for seasons before CURRENT_SEASON never change, so they are also
+kept in the tba_archive table (see database.py) and survive restarts: a
+past-season path is read from Postgres first (once per process) and only
+fetched from TBA once.  A team's award history has its past-season part
+archived the same way, so /team only fetches the current season's awards.
+
+Team nicknames are kept in a separate shared cache, filled in bulk from event
+team lists and from every team_info() lookup, so alert embeds never wait on a
+per-team request.
 """
 
 from __future__ import annotations
 
+import asyncio
 import os
 import json
-from typing import Any
+import logging
+import math
+import re
+import time
+from typing import Any, NamedTuple
 
 import aiohttp
 
+import resilience
+
 # Resolve TBA key: env var → keys.json → empty
 _TBA_KEY: str = os.environ.get("TBA_KEY", "")
 if not _TBA_KEY:
@@ -19,21 +44,184 @@ if not _TBA_KEY:
     except FileNotFoundError:
         pass
 
+log = logging.getLogger("tba")
+
 BASE = "https://www.thebluealliance.com/api/v3"
 HEADERS = {"X-TBA-Auth-Key": _TBA_KEY}
 
+CACHE_MAX_ENTRIES = 2048        # oldest paths are dropped beyond this
+NICKNAME_TTL      = 24 * 3600   # seconds a cached team nickname stays valid
+NICKNAME_REFRESH  = 12 * 3600   # seconds before an event's nicknames are prefetched again
+CURRENT_SEASON    = int(os.environ.get("FRC_SEASON", "2026"))   # the live season; earlier ones are archived
+ARCHIVE_TIMEOUT   = 2      # seconds an archive read / write may take before TBA is used instead
+ARCHIVE_RETRY     = 60     # seconds the archive is skipped after a failed or slow query
+
+_MAX_AGE_RE = re.compile(r"max-age=(\d+)")
+# The season a path belongs to: events/2024/…, event/2024casj…, awards/2024, match/2024casj_qm1
+_SEASON_RE  = re.compile(r"(?:^|/)(?:events|event|awards|match)/(\d{4})")
+
+# Rate limit, retries with backoff and a circuit breaker (see resilience.py)
+UPSTREAM = resilience.Upstream(
+    "tba",
+    rate=float(os.environ.get("TBA_RATE", "10")),   # requests per second
+    burst=20,
+)
+
+
+class _CacheEntry(NamedTuple):
+    etag:    str | None
+    expires: float        # time.monotonic() deadline for serving without revalidation
+    data:    Any
+
+
+# {path: _CacheEntry} – insertion order doubles as LRU order
+_cache: dict[str, _CacheEntry] = {}
+
+# {(path, season): data} – archive rows already read or written by this process
+_archived: dict[tuple[str, int], Any] = {}
+
+# Opened for ARCHIVE_RETRY after any archive failure, so a database outage
+# costs one ARCHIVE_TIMEOUT rather than one per TBA call
+_ARCHIVE_BREAKER = resilience.CircuitBreaker("tba_archive", reset_after=ARCHIVE_RETRY)
+
+# {path: Task} – upstream requests currently in flight, shared by concurrent get() calls
+_inflight: dict[str, asyncio.Task] = {}
+
+# {team_number: (nickname, expires_at)}
+_nicknames: dict[str, tuple[str, float]] = {}
+
+# {event_key: time.monotonic() of its last successful nickname prefetch}
+_nickname_events: dict[str, float] = {}
+
+
+def _max_age(headers) -> int:
+    """Return the Cache-Control max-age in seconds (0 if absent)."""
+    m = _MAX_AGE_RE.search(headers.get("Cache-Control", ""))
+    return int(m.group(1)) if m else 0
+
+
+def _season_of(path: str) -> int | None:
+    m = _SEASON_RE.search(path)
+    return int(m.group(1)) if m else None
+
+
+def _store(path: str, entry: _CacheEntry) -> None:
+    _cache.pop(path, None)
+    _cache[path] = entry
+    while len(_cache) > CACHE_MAX_ENTRIES:
+        _cache.pop(next(iter(_cache)))
+
 
 async def get(session: aiohttp.ClientSession, path: str) -> Any | None:
-    """GET /path from TBA.  Returns parsed JSON or None on error."""
-    url = f"{BASE}/{path.lstrip('/')}"
-    async with session.get(url, headers=HEADERS) as r:
-        if r.status != 200:
-            return None
-        return await r.json()
+    """
+    GET /path from TBA.  Returns parsed JSON or None on error.
+
+    Concurrent calls for the same path share one upstream request: the first
+    caller starts it and the rest await the same result.
+
+    The returned object may be shared with other callers through the cache –
+    treat it as read-only (use sorted() rather than list.sort()).
+    """
+    path  = path.lstrip("/")
+    entry = _cache.get(path)
+    if entry and entry.expires > time.monotonic():
+        return entry.data
+
+    task = _inflight.get(path)
+    if task is None:
+        task = asyncio.ensure_future(_fetch(session, path))
+        _inflight[path] = task
+        task.add_done_callback(lambda t: _inflight.pop(path, None) if _inflight.get(path) is t else None)
+    # Shielded so one caller giving up (e.g. an expired interaction) doesn't cancel it for the rest
+    return await asyncio.shield(task)
+
+
+async def _fetch(session: aiohttp.ClientSession, path: str) -> Any | None:
+    """The upstream half of get(): revalidate or fetch `path` and update the cache."""
+    now   = time.monotonic()
+    entry = _cache.get(path)
+
+    season = _season_of(path)
+    past   = season is not None and season < CURRENT_SEASON
+    if past and entry is None:
+        data = await _archive_get(path, season)
+        if data is not None:
+            _store(path, _CacheEntry(None, math.inf, data))
+            return data
+
+    headers = HEADERS
+    if entry and entry.etag:
+        headers = {**HEADERS, "If-None-Match": entry.etag}
+
+    r = await UPSTREAM.get(session, f"{BASE}/{path}", headers=headers)
+    if r is None or r.status == 429 or r.status >= 500:
+        # TBA is unreachable or degraded – a stale body beats no body
+        return entry.data if entry else None
+    if r.status == 304 and entry:
+        _store(path, entry._replace(expires=now + _max_age(r.headers)))
+        return entry.data
+    if r.status != 200:
+        return None
+    data    = r.data
+    etag    = r.headers.get("ETag")
+    max_age = _max_age(r.headers)
+
+    if past:
+        await _archive_put(path, season, data)
+        _store(path, _CacheEntry(etag, math.inf, data))
+    elif etag or max_age:
+        _store(path, _CacheEntry(etag, now + max_age, data))
+    return data
+
+
+# ── Past-season archive ───────────────────────────────────────────────────────
+#
+# database is imported lazily so tools that only talk to TBA (see tools/) don't
+# need a database configured; without one the archive is simply skipped.
+
+def _remember_archived(path: str, season: int, data: Any) -> None:
+    _archived.pop((path, season), None)
+    _archived[(path, season)] = data
+    while len(_archived) > CACHE_MAX_ENTRIES:
+        _archived.pop(next(iter(_archived)))
+
+
+async def _archive_get(path: str, season: int) -> Any | None:
+    data = _archived.get((path, season))
+    if data is not None or not _ARCHIVE_BREAKER.allow():
+        return data
+    try:
+        import database
+        data = await asyncio.wait_for(database.get_tba_archive(path, season), ARCHIVE_TIMEOUT)
+    except Exception as e:
+        log.warning("TBA archive read failed for %s (%d): %r", path, season, e)
+        _ARCHIVE_BREAKER.trip(ARCHIVE_RETRY)
+        return None
+    _ARCHIVE_BREAKER.record_success()
+    if data is not None:
+        _remember_archived(path, season, data)
+    return data
+
+
+async def _archive_put(path: str, season: int, data: Any) -> None:
+    _remember_archived(path, season, data)
+    if not _ARCHIVE_BREAKER.allow():
+        return
+    try:
+        import database
+        await asyncio.wait_for(database.put_tba_archive(path, season, data), ARCHIVE_TIMEOUT)
+    except Exception as e:
+        log.warning("TBA archive write failed for %s (%d): %r", path, season, e)
+        _ARCHIVE_BREAKER.trip(ARCHIVE_RETRY)
+        return
+    _ARCHIVE_BREAKER.record_success()
 
 
 async def team_info(session: aiohttp.ClientSession, team_number: str) -> dict | None:
-    return await get(session, f"team/frc{team_number}")
+    info = await get(session, f"team/frc{team_number}")
+    if info and info.get("nickname"):
+        _remember_nickname(str(team_number), info["nickname"])
+    return info
 
 
 async def team_events(session: aiohttp.ClientSession, team_number: str, year: str | None = None) -> list | None:
@@ -54,6 +242,10 @@ async def event_full(session: aiohttp.ClientSession, event_key: str) -> dict | N
     return await get(session, f"event/{event_key}")
 
 
+async def event_teams(session: aiohttp.ClientSession, event_key: str) -> list | None:
+    return await get(session, f"event/{event_key}/teams/simple")
+
+
 async def event_matches(session: aiohttp.ClientSession, event_key: str) -> list | None:
     return await get(session, f"event/{event_key}/matches")
 
@@ -67,4 +259,74 @@ async def team_robots(session: aiohttp.ClientSession, team_number: str) -> list
 
 
 async def team_awards(session: aiohttp.ClientSession, team_number: str) -> list | None:
-    return await get(session, f"team/frc{team_number}/awards")
+    """
+    Every award a team has won.  Seasons before CURRENT_SEASON come from the
+    archive, filled from one full download; after that only the current
+    season's awards are fetched.  If TBA is unreachable the archived part is
+    returned.
+    """
+    path    = f"team/frc{team_number}/awards"
+    through = CURRENT_SEASON - 1
+    past = await _archive_get(path, through)
+    if past is None:
+        full = await get(session, path)
+        if full is not None:
+            await _archive_put(path, through, [a for a in full if (a.get("year") or 0) <= through])
+        return full
+
+    current = await get(session, f"{path}/{CURRENT_SEASON}")
+    return past + (current or [])
+
+
+# ── Team nicknames (shared across cogs) ──────────────────────────────────────
+
+def _remember_nickname(team_number: str, nickname: str) -> None:
+    _nicknames[team_number] = (nickname, time.monotonic() + NICKNAME_TTL)
+
+
+async def team_nickname(session: aiohttp.ClientSession, team_number: str) -> str:
+    """Cached nickname for a team, falling back to a team_info() lookup."""
+    cached = _nicknames.get(str(team_number))
+    if cached and cached[1] > time.monotonic():
+        return cached[0]
+    info = await team_info(session, team_number)
+    if info and info.get("nickname"):
+        return info["nickname"]
+    return f"#{team_number}"
+
+
+async def prefetch_event_nicknames(session: aiohttp.ClientSession, event_key: str) -> int:
+    """Cache the nickname of every team at an event in one request. Returns the count."""
+    teams = await event_teams(session, event_key)
+    if teams is None:
+        return 0
+    _nickname_events[event_key] = time.monotonic()
+    count = 0
+    for t in teams:
+        if t.get("team_number") and t.get("nickname"):
+            _remember_nickname(str(t["team_number"]), t["nickname"])
+            count += 1
+    return count
+
+
+def event_nicknames_due(event_key: str) -> bool:
+    """
+    True if an event's nicknames were never prefetched or are due again, i.e.
+    would otherwise expire during a multi-day event.
+    """
+    fetched = _nickname_events.get(event_key)
+    return fetched is None or time.monotonic() - fetched > NICKNAME_REFRESH
+
+
+def nickname_count() -> int:
+    return len(_nicknames)
+
+
+def evict_nicknames() -> int:
+    """Drop expired nicknames; returns the number of entries still cached."""
+    now = time.monotonic()
+    for team in [t for t, (_, expires) in _nicknames.items() if expires <= now]:
+        del _nicknames[team]
+    for key in [k for k, fetched in _nickname_events.items() if now - fetched > NICKNAME_TTL]:
+        del _nickname_events[key]
+    return len(_nicknames)
@@ -131,7 +131,7 @@ class TeamInfo(commands.Cog):
             await interaction.followup.send(f"No events found for team **#{team_number}** in **{year}**.", ephemeral=True)
             return
 
-        evs.sort(key=lambda e: e.get("start_date", ""))
+        evs = sorted(evs, key=lambda e: e.get("start_date", ""))
         lines = "\n".join(
             f"`{e['key']}` – {e['name'].replace('(Cancelled)', '').strip()}"
             for e in evs
@@ -189,7 +189,7 @@ class TeamInfo(commands.Cog):
             await interaction.followup.send(f"No matches found for **#{team_number}** at `{event_key}`.", ephemeral=True)
             return
 
-        match_list.sort(key=lambda m: (m.get("comp_level", ""), m.get("match_number", 0)))
+        match_list = sorted(match_list, key=lambda m: (m.get("comp_level", ""), m.get("match_number", 0)))
 
         rows = []
         for m in match_list:
@@ -230,7 +230,7 @@ class TeamInfo(commands.Cog):
             await interaction.followup.send(f"No robots found for team **#{team_number}**.", ephemeral=True)
             return
 
-        data.sort(key=lambda r: r.get("year", 0), reverse=True)
+        data = sorted(data, key=lambda r: r.get("year", 0), reverse=True)
         embed = discord.Embed(
             title=f"🤖 #{team_number} – Robots",
             color=discord.Color.from_rgb(40, 89, 165),
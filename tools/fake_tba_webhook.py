@@ -0,0 +1,76 @@
+"""
+tools/fake_tba_webhook.py – send signed fake TBA webhook payloads to a local bot.
+
+Usage
+-----
+    TBA_WEBHOOK_SECRET=dev python tools/fake_tba_webhook.py match_score 2026isde1 2026isde1_qm12
+    TBA_WEBHOOK_SECRET=dev python tools/fake_tba_webhook.py match_score_legacy 2026isde1 2026isde1_qm12
+    TBA_WEBHOOK_SECRET=dev python tools/fake_tba_webhook.py upcoming_match 2026isde1 2026isde1_qm13
+
+The match_score payload uses the match from TBA when TBA_KEY is set, otherwise
+a made-up result for frc1..frc6.  match_score_legacy sends a made-up result in
+the older shape (alliances.<color>.teams, no winning_alliance) as match_score.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import hmac
+import json
+import os
+import sys
+
+import aiohttp
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+import tba as _tba  # noqa: E402
+
+URL    = os.environ.get("WEBHOOK_URL", "http://localhost:8080/tba/webhook")
+SECRET = os.environ.get("TBA_WEBHOOK_SECRET", "")
+
+
+def _fake_match(match_key: str) -> dict:
+    return {
+        "key": match_key,
+        "comp_level": "qm",
+        "match_number": int(match_key.rsplit("qm", 1)[-1] or 1) if "_qm" in match_key else 1,
+        "winning_alliance": "red",
+        "alliances": {
+            "red":  {"team_keys": ["frc1", "frc2", "frc3"], "score": 120},
+            "blue": {"team_keys": ["frc4", "frc5", "frc6"], "score": 95},
+        },
+    }
+
+
+def _fake_legacy_match(match_key: str) -> dict:
+    match = _fake_match(match_key)
+    del match["winning_alliance"]
+    for side in match["alliances"].values():
+        side["teams"] = side.pop("team_keys")
+    return match
+
+
+async def main(msg_type: str, event_key: str, match_key: str) -> None:
+    async with aiohttp.ClientSession() as session:
+        if msg_type == "match_score":
+            match = None
+            if _tba.HEADERS["X-TBA-Auth-Key"]:
+                match = await _tba.get(session, f"match/{match_key}")
+            data = {"event_key": event_key, "match_key": match_key, "match": match or _fake_match(match_key)}
+        elif msg_type == "match_score_legacy":
+            msg_type = "match_score"
+            data = {"event_key": event_key, "match_key": match_key, "match": _fake_legacy_match(match_key)}
+        else:
+            data = {"event_key": event_key, "match_key": match_key}
+
+        body = json.dumps({"message_type": msg_type, "message_data": data}).encode()
+        sig  = hmac.new(SECRET.encode(), body, hashlib.sha256).hexdigest()
+        async with session.post(URL, data=body, headers={"X-TBA-HMAC": sig}) as r:
+            print(f"{msg_type} → {r.status}")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 4:
+        sys.exit(__doc__)
+    asyncio.run(main(*sys.argv[1:]))